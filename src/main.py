@@ -5,20 +5,26 @@ Interactive menu-based interface for managing Amazon review datasets
 and performing integrity verification using Merkle Trees.
 """
 
-import sys
 import os
+import subprocess
+import sys
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add src directory to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from preprocessing.loader import load_with_cache
+from preprocessing.loader import (
+    load_with_cache, prefetch_batches, save_to_cache, get_datasets_info,
+    get_review_cache_path, get_leaf_cache_path, load_leaf_hashes, save_leaf_hashes
+)
 from merkle.tree import MerkleTree
-from merkle.proof import MerkleProof
 from verification.integrity_checker import IntegrityChecker
 from verification.tamper_detector import TamperDetector
-from utils.hash_utils import bytes_to_hex
+from performance.benchmark import run_construction_benchmark
+from utils.hash_utils import bytes_to_hex, hash_records
 from utils.storage import HashStorage
 
 
@@ -131,15 +137,625 @@ def get_user_choice(prompt="Enter choice: ") -> str:
         sys.exit(0)
 
 
+class AppState:
+    """Mutable state shared by the menu handlers."""
+
+    def __init__(self):
+        """Initialize empty application state."""
+        self.dataset = None
+        # (json_path, cache_dir, limit, review cache stamp) while dataset
+        # matches its source file and the review cache it was loaded with
+        self.dataset_source = None
+        self.merkle_tree = None
+        # Baseline copy kept in step with tamper simulations; a rebuild is only
+        # needed if records were deleted while no tree could follow them
+        self.current_tree = None
+        self.rebuild_needed = False
+        # Full performance suite (6.4) running in a background process
+        self.benchmark_executor = None
+        self.benchmark_job = None
+        self.integrity_checker = IntegrityChecker()
+        self.tamper_detector = TamperDetector()
+
+
+def handle_download_dataset(state: AppState) -> None:
+    """Show where to get datasets and list those in data/raw."""
+    print("\n[Download Dataset]")
+    print("Note: Dataset should be placed in data/raw/ directory")
+    print("Recommended: Electronics_5.json from Amazon review dataset")
+    print("Download from: http://jmcauley.ucsd.edu/data/amazon/\n")
+
+    if Path("data/raw").is_dir():
+        infos = get_datasets_info("data/raw")
+        if infos:
+            print("Available datasets:")
+            for name, info in infos.items():
+                print(f"  - {name}: {info['estimated_count']:,} reviews "
+                      f"({info['file_size_mb']:.1f} MB)")
+            print()
+
+
+def load_and_hash_dataset(json_path: str, cache_dir: str,
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Load an uncached dataset, hashing each batch while the next one loads.
+
+    Both caches load_with_cache() and handle_build_tree() look for are
+    written, so building the tree afterwards only reduces the leaves.
+
+    Args:
+        json_path: Path to the raw JSON file
+        cache_dir: Directory for cache files
+        limit: Maximum reviews to load (None = all)
+
+    Returns:
+        List of normalized review dictionaries
+    """
+    reviews = []
+    leaf_hashes = []
+    for batch in prefetch_batches(json_path, limit=limit):
+        reviews.extend(batch)
+        leaf_hashes.extend(MerkleTree.hash_leaves(batch))
+
+    review_cache = get_review_cache_path(json_path, cache_dir, limit)
+    if save_to_cache(reviews, review_cache):
+        save_leaf_hashes(leaf_hashes, get_leaf_cache_path(json_path, cache_dir, limit),
+                         json_path, records_path=review_cache)
+    return reviews
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (size, mtime_ns) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def handle_load_dataset(state: AppState) -> None:
+    """Load the default dataset, resetting any tree built from old data."""
+    print("\n[Load Dataset]")
+    limit_str = get_user_choice("Enter number of records to load (or press Enter for all): ")
+    limit = int(limit_str) if limit_str else None
+
+    try:
+        # Default dataset path
+        json_path = "data/raw/Electronics_5.json"
+        cache_dir = "data/cache"
+
+        print("Loading dataset...")
+        if get_review_cache_path(json_path, cache_dir, limit).exists():
+            state.dataset = load_with_cache(json_path, cache_dir, limit=limit)
+        else:
+            print("Loading from JSON and hashing leaves as batches arrive...")
+            state.dataset = load_and_hash_dataset(json_path, cache_dir, limit)
+        # Cached leaf hashes are only trusted while this file is unchanged
+        review_cache = get_review_cache_path(json_path, cache_dir, limit)
+        state.dataset_source = (json_path, cache_dir, limit, file_stamp(review_cache))
+        print(f"\nSuccessfully loaded {len(state.dataset)} reviews!")
+
+        # Reset tree when new data is loaded
+        state.merkle_tree = None
+        state.current_tree = None
+        state.rebuild_needed = False
+        print("Note: Merkle tree will need to be rebuilt.\n")
+    except Exception as e:
+        print(f"\nError loading dataset: {e}\n")
+
+
+def handle_dataset_statistics(state: AppState) -> None:
+    """Print record count, sample fields and rating distribution."""
+    if state.dataset is None:
+        print("\nNo dataset loaded. Please load a dataset first.\n")
+    else:
+        print("\n[Dataset Statistics]")
+        print(f"Total reviews: {len(state.dataset)}")
+
+        if state.dataset:
+            # Sample review
+            sample = state.dataset[0]
+            print(f"\nSample review fields:")
+            for key in sample.keys():
+                print(f"  - {key}")
+
+            # Rating distribution; Counter does the tallying in C,
+            # so the whole dataset is cheap to count
+            ratings = Counter(review.get('overall', 0) for review in state.dataset)
+            print(f"\nRating distribution:")
+            for rating in sorted(ratings.keys()):
+                print(f"  {rating} stars: {ratings[rating]}")
+        print()
+
+
+def handle_build_tree(state: AppState) -> None:
+    """Build the Merkle tree, reusing cached leaf hashes when valid."""
+    if state.dataset is None:
+        print("\nNo dataset loaded. Please load a dataset first.\n")
+    else:
+        print("\n[Build Merkle Tree]")
+        print("Building Merkle tree...")
+        try:
+            start_time = time.perf_counter_ns()
+            leaves = None
+            use_cache = False
+            if state.dataset_source is not None:
+                json_path, cache_dir, limit, records_stamp = state.dataset_source
+                review_cache = get_review_cache_path(json_path, cache_dir, limit)
+                leaf_cache = get_leaf_cache_path(json_path, cache_dir, limit)
+                # The review cache must still hold the records in memory,
+                # and the leaf hashes must have been saved against it
+                use_cache = (records_stamp is not None
+                             and file_stamp(review_cache) == records_stamp)
+                if use_cache:
+                    leaves = load_leaf_hashes(leaf_cache, json_path, review_cache)
+
+            if leaves is not None and len(leaves) == len(state.dataset):
+                print("Using cached leaf hashes...")
+                state.merkle_tree = MerkleTree.from_leaf_hashes(leaves)
+            else:
+                state.merkle_tree = MerkleTree(state.dataset, workers=os.cpu_count() or 1)
+                if use_cache:
+                    save_leaf_hashes(state.merkle_tree.get_packed_leaf_hashes(),
+                                     leaf_cache, json_path, records_path=review_cache)
+            state.current_tree = None
+            state.rebuild_needed = False
+            elapsed = (time.perf_counter_ns() - start_time) / 1_000_000
+            print(f"Merkle tree built successfully in {elapsed:.2f}ms!")
+            print(f"Root hash: {state.merkle_tree.get_root_hash_hex()[:32]}...\n")
+        except Exception as e:
+            print(f"\nError building tree: {e}\n")
+
+
+def handle_tree_info(state: AppState) -> None:
+    """Print leaf count, root hash and leaf memory of the tree."""
+    if state.merkle_tree is None:
+        print("\nNo Merkle tree built. Please build a tree first.\n")
+    else:
+        print("\n[Tree Information]")
+        leaf_count = state.merkle_tree.get_leaf_count()
+        print(f"Number of leaves: {leaf_count}")
+        print(f"Root hash: {state.merkle_tree.get_root_hash_hex()}")
+        print(f"Memory usage (leaves): ~{leaf_count * 32 / 1024:.2f} KB\n")
+
+
+def handle_export_root_hash(state: AppState) -> None:
+    """Save the current root hash under a user-given name."""
+    if state.merkle_tree is None:
+        print("\nNo Merkle tree built. Please build a tree first.\n")
+    else:
+        print("\n[Export Root Hash]")
+        name = get_user_choice("Enter a name for this root hash: ")
+        try:
+            storage = HashStorage()
+            storage.save(name, {
+                'root_hash': state.merkle_tree.get_root_hash_hex(),
+                'num_leaves': state.merkle_tree.get_leaf_count()
+            })
+            print(f"Root hash saved as '{name}'!\n")
+        except Exception as e:
+            print(f"\nError saving root hash: {e}\n")
+
+
+def handle_verify_integrity(state: AppState) -> None:
+    """Verify the loaded dataset against the tree root."""
+    if state.dataset is None or state.merkle_tree is None:
+        print("\nPlease load dataset and build tree first.\n")
+    else:
+        print("\n[Verify Dataset Integrity]")
+        try:
+            result = state.integrity_checker.verify(state.dataset, state.merkle_tree.get_root_hash())
+            if result:
+                print("✓ Dataset integrity verified! Data is intact.\n")
+            else:
+                print("✗ Integrity check failed! Data may have been tampered.\n")
+        except Exception as e:
+            print(f"\nError during verification: {e}\n")
+
+
+def handle_store_root_hash(state: AppState) -> None:
+    """Store the current root hash as the integrity baseline."""
+    if state.merkle_tree is None:
+        print("\nNo Merkle tree built. Please build a tree first.\n")
+    else:
+        print("\n[Store Current Root Hash]")
+        try:
+            state.integrity_checker.save_baseline(state.merkle_tree.get_root_hash())
+            print("Baseline root hash saved successfully!\n")
+        except Exception as e:
+            print(f"\nError saving baseline: {e}\n")
+
+
+def handle_compare_root_hash(state: AppState) -> None:
+    """Compare the current root hash with the stored baseline."""
+    if state.merkle_tree is None:
+        print("\nNo Merkle tree built. Please build a tree first.\n")
+    else:
+        print("\n[Compare with Stored Hash]")
+        try:
+            result = state.integrity_checker.compare_with_baseline(state.merkle_tree.get_root_hash())
+            if result:
+                print("✓ Root hash matches stored baseline!\n")
+            else:
+                print("✗ Root hash differs from baseline! Data may have changed.\n")
+        except Exception as e:
+            print(f"\nError comparing with baseline: {e}\n")
+
+
+def handle_generate_proof(state: AppState) -> None:
+    """Generate an existence proof for one review."""
+    if state.dataset is None or state.merkle_tree is None:
+        print("\nPlease load dataset and build tree first.\n")
+    else:
+        print("\n[Generate Proof for Review]")
+        index_str = get_user_choice(f"Enter review index (0-{len(state.dataset)-1}): ")
+        try:
+            index = int(index_str)
+            if index < 0 or index >= len(state.dataset):
+                print(f"\nInvalid index. Must be between 0 and {len(state.dataset)-1}.\n")
+            else:
+                proof = state.merkle_tree.get_proof(index, state.dataset[index])
+                print(f"\nProof generated for review at index {index}:")
+                print(f"  Proof path length: {len(proof.proof_path)}")
+                print(f"  Leaf index: {proof.leaf_index}")
+                print(f"  Root hash: {bytes_to_hex(proof.root_hash)[:32]}...\n")
+        except ValueError:
+            print("\nInvalid input. Please enter a number.\n")
+        except Exception as e:
+            print(f"\nError generating proof: {e}\n")
+
+
+def handle_verify_proof(state: AppState) -> None:
+    """Generate and verify an existence proof for one review."""
+    if state.dataset is None or state.merkle_tree is None:
+        print("\nPlease load dataset and build tree first.\n")
+    else:
+        print("\n[Verify Proof]")
+        index_str = get_user_choice(f"Enter review index to verify (0-{len(state.dataset)-1}): ")
+        try:
+            index = int(index_str)
+            if index < 0 or index >= len(state.dataset):
+                print(f"\nInvalid index. Must be between 0 and {len(state.dataset)-1}.\n")
+            else:
+                proof = state.merkle_tree.get_proof(index, state.dataset[index])
+                is_valid = proof.verify()
+                if is_valid:
+                    print("✓ Proof verified! Review exists in dataset.\n")
+                else:
+                    print("✗ Proof verification failed!\n")
+        except ValueError:
+            print("\nInvalid input. Please enter a number.\n")
+        except Exception as e:
+            print(f"\nError verifying proof: {e}\n")
+
+
+def handle_batch_proofs(state: AppState) -> None:
+    """Generate proofs for the first N reviews and report timing."""
+    if state.dataset is None or state.merkle_tree is None:
+        print("\nPlease load dataset and build tree first.\n")
+    else:
+        print("\n[Batch Proof Generation]")
+        count_str = get_user_choice("Enter number of proofs to generate: ")
+        try:
+            count = int(count_str)
+            if count <= 0 or count > len(state.dataset):
+                print(f"\nInvalid count. Must be between 1 and {len(state.dataset)}.\n")
+            else:
+                start_time = time.perf_counter_ns()
+                proofs = state.merkle_tree.get_proofs_range(0, count, state.dataset[:count])
+                elapsed = (time.perf_counter_ns() - start_time) / 1_000_000
+                print(f"\nGenerated {count} proofs in {elapsed:.2f}ms")
+                print(f"Average: {elapsed/count:.4f}ms per proof\n")
+        except ValueError:
+            print("\nInvalid input. Please enter a number.\n")
+        except Exception as e:
+            print(f"\nError in batch generation: {e}\n")
+
+
+def handle_simulate_modification(state: AppState) -> None:
+    """Tamper with one review and update the tamper tree."""
+    if state.dataset is None:
+        print("\nNo dataset loaded. Please load a dataset first.\n")
+    else:
+        print("\n[Simulate Modification]")
+        index_str = get_user_choice(f"Enter review index to modify (0-{len(state.dataset)-1}): ")
+        try:
+            index = int(index_str)
+            if index < 0 or index >= len(state.dataset):
+                print(f"\nInvalid index. Must be between 0 and {len(state.dataset)-1}.\n")
+            else:
+                # Modify the review
+                state.dataset[index]['overall'] = 5.0
+                state.dataset[index]['reviewText'] = "TAMPERED REVIEW"
+                state.dataset_source = None
+                print(f"Modified review at index {index}")
+                if state.merkle_tree is not None and not state.rebuild_needed:
+                    if state.current_tree is None:
+                        state.current_tree = state.merkle_tree.copy()
+                    state.current_tree.update_leaf(index, state.dataset[index])
+                    print(f"New root hash: {state.current_tree.get_root_hash_hex()[:32]}...\n")
+                else:
+                    print("Note: Rebuild tree to see the impact on root hash.\n")
+        except ValueError:
+            print("\nInvalid input. Please enter a number.\n")
+        except Exception as e:
+            print(f"\nError during modification: {e}\n")
+
+
+def handle_simulate_deletion(state: AppState) -> None:
+    """Delete one review and update the tamper tree."""
+    if state.dataset is None:
+        print("\nNo dataset loaded. Please load a dataset first.\n")
+    else:
+        print("\n[Simulate Deletion]")
+        index_str = get_user_choice(f"Enter review index to delete (0-{len(state.dataset)-1}): ")
+        try:
+            index = int(index_str)
+            if index < 0 or index >= len(state.dataset):
+                print(f"\nInvalid index. Must be between 0 and {len(state.dataset)-1}.\n")
+            else:
+                del state.dataset[index]
+                state.dataset_source = None
+                print(f"Deleted review at index {index}")
+                print(f"New dataset size: {len(state.dataset)}")
+                if state.merkle_tree is not None and not state.rebuild_needed and state.dataset:
+                    if state.current_tree is None:
+                        state.current_tree = state.merkle_tree.copy()
+                    state.current_tree.remove_leaf(index)
+                    print(f"New root hash: {state.current_tree.get_root_hash_hex()[:32]}...\n")
+                else:
+                    state.current_tree = None
+                    state.rebuild_needed = True
+                    print("Note: Rebuild tree to see the impact on root hash.\n")
+        except ValueError:
+            print("\nInvalid input. Please enter a number.\n")
+        except Exception as e:
+            print(f"\nError during deletion: {e}\n")
+
+
+def handle_simulate_insertion(state: AppState) -> None:
+    """Append a fake review and update the tamper tree."""
+    if state.dataset is None:
+        print("\nNo dataset loaded. Please load a dataset first.\n")
+    else:
+        print("\n[Simulate Insertion]")
+        fake_review = {
+            'reviewerID': 'FAKE_REVIEWER',
+            'asin': 'FAKE_PRODUCT',
+            'overall': 5.0,
+            'unixReviewTime': 0,
+            'reviewText': 'This is a fake inserted review'
+        }
+        state.dataset.append(fake_review)
+        state.dataset_source = None
+        print(f"Inserted fake review at end of dataset")
+        print(f"New dataset size: {len(state.dataset)}")
+        if state.merkle_tree is not None and not state.rebuild_needed:
+            if state.current_tree is None:
+                state.current_tree = state.merkle_tree.copy()
+            state.current_tree.append_leaf(fake_review)
+            print(f"New root hash: {state.current_tree.get_root_hash_hex()[:32]}...\n")
+        else:
+            print("Note: Rebuild tree to see the impact on root hash.\n")
+
+
+def handle_tamper_report(state: AppState) -> None:
+    """Compare the tamper tree with the baseline and print a report."""
+    if state.dataset is None or state.merkle_tree is None:
+        print("\nPlease load dataset and build tree first.\n")
+    else:
+        print("\n[Generate Tamper Report]")
+        try:
+            # Tamper simulations already reached current_tree
+            if state.rebuild_needed:
+                state.current_tree = MerkleTree(state.dataset, workers=os.cpu_count() or 1)
+                state.rebuild_needed = False
+            elif state.current_tree is None:
+                state.current_tree = state.merkle_tree.copy()
+
+            result = state.tamper_detector.detect_tampering(state.merkle_tree, state.current_tree)
+            print(state.tamper_detector.generate_tampering_report(result))
+        except Exception as e:
+            print(f"\nError generating tamper report: {e}\n")
+
+
+def handle_hashing_speed(state: AppState) -> None:
+    """Measure leaf hashing throughput."""
+    print("\n[Measure Hashing Speed]")
+    try:
+        if state.dataset is None:
+            # One random buffer of 64-byte records: no per-record
+            # objects, so the timing is SHA-256 alone
+            print("No dataset loaded. Using synthetic 64-byte records...\n")
+            count = 100000
+            records = os.urandom(64 * count)
+            start_time = time.perf_counter_ns()
+            hash_records(records, 64)
+        else:
+            sample = state.dataset[:100000]
+            count = len(sample)
+            start_time = time.perf_counter_ns()
+            MerkleTree.hash_leaves(sample)
+        elapsed = (time.perf_counter_ns() - start_time) / 1_000_000_000
+        speed = count / elapsed if elapsed > 0 else float('inf')
+        print(f"Hashing speed: {speed:.0f} hashes/second")
+        print(f"Time for {count:,} hashes: {elapsed:.2f}s\n")
+    except Exception as e:
+        print(f"\nError measuring hashing speed: {e}\n")
+
+
+def handle_construction_benchmark(state: AppState) -> None:
+    """Time a full tree build over the loaded dataset."""
+    if state.dataset is None:
+        print("\nNo dataset loaded. Please load a dataset first.\n")
+    else:
+        print("\n[Benchmark Tree Construction]")
+        try:
+            start_time = time.perf_counter_ns()
+            test_tree = MerkleTree(state.dataset, workers=os.cpu_count() or 1)
+            elapsed = (time.perf_counter_ns() - start_time) / 1_000_000
+            print(f"Tree construction time: {elapsed:.2f}ms")
+            print(f"Dataset size: {len(state.dataset)} records")
+            print(f"Average: {elapsed/len(state.dataset):.6f}ms per record\n")
+        except Exception as e:
+            print(f"\nError benchmarking tree construction: {e}\n")
+
+
+def handle_proof_benchmark(state: AppState) -> None:
+    """Time batch proof generation."""
+    if state.dataset is None or state.merkle_tree is None:
+        print("\nPlease load dataset and build tree first.\n")
+    else:
+        print("\n[Benchmark Proof Generation]")
+        count_str = get_user_choice("Enter number of proofs to test (default: 1000): ")
+        count = int(count_str) if count_str else 1000
+        count = min(count, len(state.dataset))
+
+        try:
+            start_time = time.perf_counter_ns()
+            proofs = state.merkle_tree.get_proofs_range(0, count, state.dataset[:count])
+            elapsed = (time.perf_counter_ns() - start_time) / 1_000_000
+            print(f"\nGenerated {count} proofs in {elapsed:.2f}ms")
+            print(f"Average: {elapsed/count:.4f}ms per proof\n")
+        except Exception as e:
+            print(f"\nError benchmarking proof generation: {e}\n")
+
+
+def handle_full_benchmark(state: AppState) -> None:
+    """
+    Run the benchmark suite over several dataset sizes in the background.
+
+    The suite runs in one worker process so the menu stays usable; sizes
+    are still built one at a time there, keeping the timings valid.
+    Choosing the option again reports progress or prints the results.
+    """
+    print("\n[Run Full Performance Suite]")
+    if state.benchmark_job is not None:
+        if not state.benchmark_job.done():
+            print("Benchmark is still running in the background. "
+                  "Choose 6.4 again to check.\n")
+            return
+        job = state.benchmark_job
+        state.benchmark_job = None
+        state.benchmark_executor.shutdown()
+        state.benchmark_executor = None
+        try:
+            output, results = job.result()
+            print(output, end='')
+            print("\nBenchmark complete!\n")
+        except Exception as e:
+            print(f"\nError running full benchmark: {e}\n")
+        return
+
+    print("Running comprehensive benchmarks...")
+    print("This will test with datasets of sizes: 100, 1K, 10K, 100K")
+    confirm = get_user_choice("This may take a while. Continue? (y/n): ")
+    if confirm.lower() == 'y':
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+
+            sizes = [100, 1000, 10000, 100000]
+            state.benchmark_executor = ProcessPoolExecutor(max_workers=1)
+            state.benchmark_job = state.benchmark_executor.submit(
+                run_construction_benchmark, sizes)
+            print("Benchmark started in the background. "
+                  "Choose 6.4 again to see the results.\n")
+        except Exception as e:
+            print(f"\nError running full benchmark: {e}\n")
+    else:
+        print("Benchmark cancelled.\n")
+
+
+def handle_run_tests(state: AppState) -> None:
+    """Run the pytest suite and print its output."""
+    print("\n[Run All Required Test Cases]")
+    print("Running pytest test suite...\n")
+    try:
+        # Run from the repository root (the parent of src/), wherever it lives,
+        # with the interpreter running this CLI
+        repo_root = Path(__file__).resolve().parent.parent
+        result = subprocess.run(
+            [sys.executable, '-m', 'pytest', 'tests/', '-v', '--tb=short'],
+            cwd=repo_root,
+            capture_output=True,
+            text=True
+        )
+        print(result.stdout)
+        if result.returncode == 0:
+            print("\n✓ All tests passed!\n")
+        else:
+            print("\n✗ Some tests failed. See output above.\n")
+    except Exception as e:
+        print(f"\nError running tests: {e}")
+        print("Try running: pytest tests/ -v\n")
+
+
+# Submenu printer and option handlers for each main menu choice
+MENUS = {
+    '1': (print_data_menu, {
+        '1.1': handle_download_dataset,
+        '1.2': handle_load_dataset,
+        '1.3': handle_dataset_statistics,
+    }),
+    '2': (print_tree_menu, {
+        '2.1': handle_build_tree,
+        '2.2': handle_tree_info,
+        '2.3': handle_export_root_hash,
+    }),
+    '3': (print_verification_menu, {
+        '3.1': handle_verify_integrity,
+        '3.2': handle_store_root_hash,
+        '3.3': handle_compare_root_hash,
+    }),
+    '4': (print_proof_menu, {
+        '4.1': handle_generate_proof,
+        '4.2': handle_verify_proof,
+        '4.3': handle_batch_proofs,
+    }),
+    '5': (print_tamper_menu, {
+        '5.1': handle_simulate_modification,
+        '5.2': handle_simulate_deletion,
+        '5.3': handle_simulate_insertion,
+        '5.4': handle_tamper_report,
+    }),
+    '6': (print_performance_menu, {
+        '6.1': handle_hashing_speed,
+        '6.2': handle_construction_benchmark,
+        '6.3': handle_proof_benchmark,
+        '6.4': handle_full_benchmark,
+    }),
+    '7': (print_test_cases_menu, {
+        '7.1': handle_run_tests,
+    }),
+}
+
+
+def run_menu(state: AppState, print_menu: Callable[[], None],
+             handlers: Dict[str, Callable[[AppState], None]]) -> None:
+    """
+    Run a submenu until the user chooses to go back.
+
+    Args:
+        state: Application state passed to each handler
+        print_menu: Function that displays the submenu
+        handlers: Option string (e.g. '1.2') to handler function
+    """
+    while True:
+        print_menu()
+        sub_choice = get_user_choice()
+        if sub_choice == '0':
+            break
+        handler = handlers.get(sub_choice)
+        if handler is None:
+            print("\nInvalid choice. Please try again.\n")
+        else:
+            handler(state)
+
+
 def main():
     """Main application loop."""
     print_header()
-
-    # Application state
-    dataset = None
-    merkle_tree = None
-    integrity_checker = IntegrityChecker()
-    tamper_detector = TamperDetector()
+    state = AppState()
 
     while True:
         print_main_menu()
@@ -150,423 +766,11 @@ def main():
             print("Goodbye!\n")
             break
 
-        elif choice == '1':
-            # Data Management
-            while True:
-                print_data_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '1.1':
-                    print("\n[Download Dataset]")
-                    print("Note: Dataset should be placed in data/raw/ directory")
-                    print("Recommended: Electronics_5.json from Amazon review dataset")
-                    print("Download from: http://jmcauley.ucsd.edu/data/amazon/\n")
-                elif sub_choice == '1.2':
-                    print("\n[Load Dataset]")
-                    limit_str = get_user_choice("Enter number of records to load (or press Enter for all): ")
-                    limit = int(limit_str) if limit_str else None
-
-                    try:
-                        # Default dataset path
-                        json_path = "data/raw/Electronics_5.json"
-                        cache_dir = "data/cache"
-
-                        print("Loading dataset...")
-                        dataset = load_with_cache(json_path, cache_dir, limit=limit)
-                        print(f"\nSuccessfully loaded {len(dataset)} reviews!")
-
-                        # Reset tree when new data is loaded
-                        merkle_tree = None
-                        print("Note: Merkle tree will need to be rebuilt.\n")
-                    except Exception as e:
-                        print(f"\nError loading dataset: {e}\n")
-                elif sub_choice == '1.3':
-                    if dataset is None:
-                        print("\nNo dataset loaded. Please load a dataset first.\n")
-                    else:
-                        print("\n[Dataset Statistics]")
-                        print(f"Total reviews: {len(dataset)}")
-
-                        if dataset:
-                            # Sample review
-                            sample = dataset[0]
-                            print(f"\nSample review fields:")
-                            for key in sample.keys():
-                                print(f"  - {key}")
-
-                            # Rating distribution
-                            ratings = {}
-                            for review in dataset[:1000]:  # Sample first 1000
-                                rating = review.get('overall', 0)
-                                ratings[rating] = ratings.get(rating, 0) + 1
-                            print(f"\nRating distribution (first 1000):")
-                            for rating in sorted(ratings.keys()):
-                                print(f"  {rating} stars: {ratings[rating]}")
-                        print()
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        elif choice == '2':
-            # Merkle Tree Operations
-            while True:
-                print_tree_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '2.1':
-                    if dataset is None:
-                        print("\nNo dataset loaded. Please load a dataset first.\n")
-                    else:
-                        print("\n[Build Merkle Tree]")
-                        print("Building Merkle tree...")
-                        try:
-                            import time
-                            start_time = time.time()
-                            merkle_tree = MerkleTree(dataset)
-                            elapsed = (time.time() - start_time) * 1000
-                            print(f"Merkle tree built successfully in {elapsed:.2f}ms!")
-                            print(f"Root hash: {merkle_tree.get_root_hash_hex()[:32]}...\n")
-                        except Exception as e:
-                            print(f"\nError building tree: {e}\n")
-                elif sub_choice == '2.2':
-                    if merkle_tree is None:
-                        print("\nNo Merkle tree built. Please build a tree first.\n")
-                    else:
-                        print("\n[Tree Information]")
-                        leaf_count = merkle_tree.get_leaf_count()
-                        print(f"Number of leaves: {leaf_count}")
-                        print(f"Root hash: {merkle_tree.get_root_hash_hex()}")
-                        print(f"Memory usage (leaves): ~{leaf_count * 32 / 1024:.2f} KB\n")
-                elif sub_choice == '2.3':
-                    if merkle_tree is None:
-                        print("\nNo Merkle tree built. Please build a tree first.\n")
-                    else:
-                        print("\n[Export Root Hash]")
-                        name = get_user_choice("Enter a name for this root hash: ")
-                        try:
-                            storage = HashStorage()
-                            storage.save(name, {
-                                'root_hash': merkle_tree.get_root_hash_hex(),
-                                'num_leaves': merkle_tree.get_leaf_count()
-                            })
-                            print(f"Root hash saved as '{name}'!\n")
-                        except Exception as e:
-                            print(f"\nError saving root hash: {e}\n")
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        elif choice == '3':
-            # Integrity Verification
-            while True:
-                print_verification_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '3.1':
-                    if dataset is None or merkle_tree is None:
-                        print("\nPlease load dataset and build tree first.\n")
-                    else:
-                        print("\n[Verify Dataset Integrity]")
-                        try:
-                            result = integrity_checker.verify(dataset, merkle_tree.get_root_hash())
-                            if result:
-                                print("✓ Dataset integrity verified! Data is intact.\n")
-                            else:
-                                print("✗ Integrity check failed! Data may have been tampered.\n")
-                        except Exception as e:
-                            print(f"\nError during verification: {e}\n")
-                elif sub_choice == '3.2':
-                    if merkle_tree is None:
-                        print("\nNo Merkle tree built. Please build a tree first.\n")
-                    else:
-                        print("\n[Store Current Root Hash]")
-                        try:
-                            integrity_checker.save_baseline(merkle_tree.get_root_hash())
-                            print("Baseline root hash saved successfully!\n")
-                        except Exception as e:
-                            print(f"\nError saving baseline: {e}\n")
-                elif sub_choice == '3.3':
-                    if merkle_tree is None:
-                        print("\nNo Merkle tree built. Please build a tree first.\n")
-                    else:
-                        print("\n[Compare with Stored Hash]")
-                        try:
-                            result = integrity_checker.compare_with_baseline(merkle_tree.get_root_hash())
-                            if result:
-                                print("✓ Root hash matches stored baseline!\n")
-                            else:
-                                print("✗ Root hash differs from baseline! Data may have changed.\n")
-                        except Exception as e:
-                            print(f"\nError comparing with baseline: {e}\n")
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        elif choice == '4':
-            # Existence Proofs
-            while True:
-                print_proof_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '4.1':
-                    if dataset is None or merkle_tree is None:
-                        print("\nPlease load dataset and build tree first.\n")
-                    else:
-                        print("\n[Generate Proof for Review]")
-                        index_str = get_user_choice(f"Enter review index (0-{len(dataset)-1}): ")
-                        try:
-                            index = int(index_str)
-                            if index < 0 or index >= len(dataset):
-                                print(f"\nInvalid index. Must be between 0 and {len(dataset)-1}.\n")
-                            else:
-                                proof = merkle_tree.get_proof(index, dataset[index])
-                                print(f"\nProof generated for review at index {index}:")
-                                print(f"  Proof path length: {len(proof.proof_path)}")
-                                print(f"  Leaf index: {proof.leaf_index}")
-                                print(f"  Root hash: {bytes_to_hex(proof.root_hash)[:32]}...\n")
-                        except ValueError:
-                            print("\nInvalid input. Please enter a number.\n")
-                        except Exception as e:
-                            print(f"\nError generating proof: {e}\n")
-                elif sub_choice == '4.2':
-                    if dataset is None or merkle_tree is None:
-                        print("\nPlease load dataset and build tree first.\n")
-                    else:
-                        print("\n[Verify Proof]")
-                        index_str = get_user_choice(f"Enter review index to verify (0-{len(dataset)-1}): ")
-                        try:
-                            index = int(index_str)
-                            if index < 0 or index >= len(dataset):
-                                print(f"\nInvalid index. Must be between 0 and {len(dataset)-1}.\n")
-                            else:
-                                proof = merkle_tree.get_proof(index, dataset[index])
-                                is_valid = proof.verify()
-                                if is_valid:
-                                    print("✓ Proof verified! Review exists in dataset.\n")
-                                else:
-                                    print("✗ Proof verification failed!\n")
-                        except ValueError:
-                            print("\nInvalid input. Please enter a number.\n")
-                        except Exception as e:
-                            print(f"\nError verifying proof: {e}\n")
-                elif sub_choice == '4.3':
-                    if dataset is None or merkle_tree is None:
-                        print("\nPlease load dataset and build tree first.\n")
-                    else:
-                        print("\n[Batch Proof Generation]")
-                        count_str = get_user_choice("Enter number of proofs to generate: ")
-                        try:
-                            count = int(count_str)
-                            if count <= 0 or count > len(dataset):
-                                print(f"\nInvalid count. Must be between 1 and {len(dataset)}.\n")
-                            else:
-                                import time
-                                start_time = time.time()
-                                proofs = []
-                                for i in range(count):
-                                    proof = merkle_tree.get_proof(i, dataset[i])
-                                    proofs.append(proof)
-                                elapsed = (time.time() - start_time) * 1000
-                                print(f"\nGenerated {count} proofs in {elapsed:.2f}ms")
-                                print(f"Average: {elapsed/count:.4f}ms per proof\n")
-                        except ValueError:
-                            print("\nInvalid input. Please enter a number.\n")
-                        except Exception as e:
-                            print(f"\nError in batch generation: {e}\n")
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        elif choice == '5':
-            # Tamper Detection
-            while True:
-                print_tamper_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '5.1':
-                    if dataset is None:
-                        print("\nNo dataset loaded. Please load a dataset first.\n")
-                    else:
-                        print("\n[Simulate Modification]")
-                        index_str = get_user_choice(f"Enter review index to modify (0-{len(dataset)-1}): ")
-                        try:
-                            index = int(index_str)
-                            if index < 0 or index >= len(dataset):
-                                print(f"\nInvalid index. Must be between 0 and {len(dataset)-1}.\n")
-                            else:
-                                # Modify the review
-                                dataset[index]['overall'] = 5.0
-                                dataset[index]['reviewText'] = "TAMPERED REVIEW"
-                                print(f"Modified review at index {index}")
-                                print("Note: Rebuild tree to see the impact on root hash.\n")
-                        except ValueError:
-                            print("\nInvalid input. Please enter a number.\n")
-                        except Exception as e:
-                            print(f"\nError during modification: {e}\n")
-                elif sub_choice == '5.2':
-                    if dataset is None:
-                        print("\nNo dataset loaded. Please load a dataset first.\n")
-                    else:
-                        print("\n[Simulate Deletion]")
-                        index_str = get_user_choice(f"Enter review index to delete (0-{len(dataset)-1}): ")
-                        try:
-                            index = int(index_str)
-                            if index < 0 or index >= len(dataset):
-                                print(f"\nInvalid index. Must be between 0 and {len(dataset)-1}.\n")
-                            else:
-                                del dataset[index]
-                                print(f"Deleted review at index {index}")
-                                print(f"New dataset size: {len(dataset)}")
-                                print("Note: Rebuild tree to see the impact on root hash.\n")
-                        except ValueError:
-                            print("\nInvalid input. Please enter a number.\n")
-                        except Exception as e:
-                            print(f"\nError during deletion: {e}\n")
-                elif sub_choice == '5.3':
-                    if dataset is None:
-                        print("\nNo dataset loaded. Please load a dataset first.\n")
-                    else:
-                        print("\n[Simulate Insertion]")
-                        fake_review = {
-                            'reviewerID': 'FAKE_REVIEWER',
-                            'asin': 'FAKE_PRODUCT',
-                            'overall': 5.0,
-                            'unixReviewTime': 0,
-                            'reviewText': 'This is a fake inserted review'
-                        }
-                        dataset.append(fake_review)
-                        print(f"Inserted fake review at end of dataset")
-                        print(f"New dataset size: {len(dataset)}")
-                        print("Note: Rebuild tree to see the impact on root hash.\n")
-                elif sub_choice == '5.4':
-                    if dataset is None or merkle_tree is None:
-                        print("\nPlease load dataset and build tree first.\n")
-                    else:
-                        print("\n[Generate Tamper Report]")
-                        try:
-                            # Build new tree with current (possibly tampered) data
-                            current_tree = MerkleTree(dataset)
-                            report = tamper_detector.generate_report(
-                                merkle_tree.get_root_hash(),
-                                current_tree.get_root_hash(),
-                                dataset
-                            )
-                            print(report)
-                        except Exception as e:
-                            print(f"\nError generating tamper report: {e}\n")
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        elif choice == '6':
-            # Performance Testing
-            while True:
-                print_performance_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '6.1':
-                    print("\n[Measure Hashing Speed]")
-                    if dataset is None:
-                        print("No dataset loaded. Using synthetic data...\n")
-                        test_data = [{'reviewText': f'Review {i}'} for i in range(100000)]
-                    else:
-                        test_data = dataset
-
-                    try:
-                        from performance.metrics import measure_hashing_speed
-                        import time
-                        start_time = time.time()
-                        speed = measure_hashing_speed(test_data[:100000])
-                        elapsed = time.time() - start_time
-                        print(f"Hashing speed: {speed:.0f} hashes/second")
-                        print(f"Time for 100K hashes: {elapsed:.2f}s\n")
-                    except Exception as e:
-                        print(f"\nError measuring hashing speed: {e}\n")
-                elif sub_choice == '6.2':
-                    if dataset is None:
-                        print("\nNo dataset loaded. Please load a dataset first.\n")
-                    else:
-                        print("\n[Benchmark Tree Construction]")
-                        try:
-                            import time
-                            start_time = time.time()
-                            test_tree = MerkleTree(dataset)
-                            elapsed = (time.time() - start_time) * 1000
-                            print(f"Tree construction time: {elapsed:.2f}ms")
-                            print(f"Dataset size: {len(dataset)} records")
-                            print(f"Average: {elapsed/len(dataset):.6f}ms per record\n")
-                        except Exception as e:
-                            print(f"\nError benchmarking tree construction: {e}\n")
-                elif sub_choice == '6.3':
-                    if dataset is None or merkle_tree is None:
-                        print("\nPlease load dataset and build tree first.\n")
-                    else:
-                        print("\n[Benchmark Proof Generation]")
-                        count_str = get_user_choice("Enter number of proofs to test (default: 1000): ")
-                        count = int(count_str) if count_str else 1000
-                        count = min(count, len(dataset))
-
-                        try:
-                            import time
-                            start_time = time.time()
-                            for i in range(count):
-                                proof = merkle_tree.get_proof(i, dataset[i])
-                            elapsed = (time.time() - start_time) * 1000
-                            print(f"\nGenerated {count} proofs in {elapsed:.2f}ms")
-                            print(f"Average: {elapsed/count:.4f}ms per proof\n")
-                        except Exception as e:
-                            print(f"\nError benchmarking proof generation: {e}\n")
-                elif sub_choice == '6.4':
-                    print("\n[Run Full Performance Suite]")
-                    print("Running comprehensive benchmarks...")
-                    print("This will test with datasets of sizes: 100, 1K, 10K, 100K")
-                    confirm = get_user_choice("This may take a while. Continue? (y/n): ")
-                    if confirm.lower() == 'y':
-                        try:
-                            from performance.benchmark import MerkleTreeBenchmark
-                            bench = MerkleTreeBenchmark()
-                            sizes = [100, 1000, 10000, 100000]
-                            results = bench.benchmark_tree_construction(sizes)
-                            print("\nBenchmark complete! Results saved to benchmarks/results/\n")
-                        except Exception as e:
-                            print(f"\nError running full benchmark: {e}\n")
-                    else:
-                        print("Benchmark cancelled.\n")
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        elif choice == '7':
-            # Test Cases
-            while True:
-                print_test_cases_menu()
-                sub_choice = get_user_choice()
-                if sub_choice == '0':
-                    break
-                elif sub_choice == '7.1':
-                    print("\n[Run All Required Test Cases]")
-                    print("Running pytest test suite...\n")
-                    try:
-                        import subprocess
-                        result = subprocess.run(
-                            ['pytest', 'tests/', '-v', '--tb=short'],
-                            cwd='/Users/sobanahmad/Fast-Nuces/Semester 7/Algo/final',
-                            capture_output=True,
-                            text=True
-                        )
-                        print(result.stdout)
-                        if result.returncode == 0:
-                            print("\n✓ All tests passed!\n")
-                        else:
-                            print("\n✗ Some tests failed. See output above.\n")
-                    except Exception as e:
-                        print(f"\nError running tests: {e}")
-                        print("Try running: pytest tests/ -v\n")
-                else:
-                    print("\nInvalid choice. Please try again.\n")
-
-        else:
+        menu = MENUS.get(choice)
+        if menu is None:
             print("\nInvalid choice. Please try again.\n")
+        else:
+            run_menu(state, *menu)
 
 
 if __name__ == "__main__":
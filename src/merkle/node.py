@@ -1,8 +1,8 @@
 """
 Merkle Tree Node implementation.
 
-Used temporarily during tree construction, then discarded after extracting
-root hash and leaf hashes for hybrid storage approach.
+Explicit node structure for callers that want to walk a tree. MerkleTree
+itself builds levels of raw hash bytes and never allocates nodes.
 
 Key design decisions:
 - Uses __slots__ for memory efficiency
@@ -17,8 +17,7 @@ class MerkleNode:
     """
     A node in the Merkle tree.
 
-    This class is used during tree construction but NOT stored long-term.
-    After building the tree, we only keep root hash + leaf hashes.
+    MerkleTree does not store nodes; it keeps only root hash + leaf hashes.
 
     Attributes:
         hash: SHA-256 digest as raw bytes (32 bytes, NOT hex string)
@@ -13,7 +13,7 @@ Key design decisions:
 """
 
 from typing import List, Tuple, Dict, Any, Optional
-from utils.hash_utils import hash_data, hash_pair, hash_review, bytes_to_hex, hex_to_bytes
+from utils.hash_utils import hash_data, hash_review, fold_path, bytes_to_hex, hex_to_bytes
 
 
 class MerkleProof:
@@ -96,17 +96,8 @@ class MerkleProof:
         else:
             current_hash = hash_data(str(self.leaf_data))
 
-        # Step 2: Walk up the tree combining with siblings
-        for sibling_hash, is_left in self.proof_path:
-            if is_left:
-                # Sibling is on the left, we are on the right
-                current_hash = hash_pair(sibling_hash, current_hash)
-            else:
-                # Sibling is on the right, we are on the left
-                current_hash = hash_pair(current_hash, sibling_hash)
-
-        # Step 3: Compare with root hash
-        return current_hash == self.root_hash
+        # Steps 2-3: Walk up the tree combining with siblings, compare with root
+        return fold_path(current_hash, self.proof_path) == self.root_hash
 
     @staticmethod
     def verify_proof(leaf_data: Any,
@@ -134,15 +125,8 @@ class MerkleProof:
         else:
             current_hash = hash_data(str(leaf_data))
 
-        # Walk up the tree
-        for sibling_hash, is_left in proof_path:
-            if is_left:
-                current_hash = hash_pair(sibling_hash, current_hash)
-            else:
-                current_hash = hash_pair(current_hash, sibling_hash)
-
-        # Compare
-        return current_hash == root_hash
+        # Walk up the tree and compare
+        return fold_path(current_hash, proof_path) == root_hash
 
     def get_proof_length(self) -> int:
         """
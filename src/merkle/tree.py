@@ -2,9 +2,12 @@
 Merkle Tree implementation with hybrid storage approach.
 
 HYBRID STORAGE DESIGN:
-- During construction: Build complete binary tree in memory
-- After construction: Store only root hash + array of leaf hashes (32 bytes each)
-- For proofs: Rebuild tree path on demand from leaf hashes
+- During construction: Hash leaves, then reduce levels of raw hashes
+- After construction: Store only root hash + one contiguous buffer of leaf
+  hashes (32 bytes each, no per-hash object overhead)
+- Cached layer: Keep the ~sqrt(N) nodes at the middle level of the tree
+- For proofs/updates: Rebuild one block of leaves up to the cached layer,
+  then the cached layer up to the root - O(sqrt(N)) instead of O(N)
 - Memory: ~32MB for 1M records (vs 700MB for full tree storage)
 
 Key optimizations:
@@ -16,21 +19,64 @@ Key optimizations:
 from typing import List, Optional, Dict, Any, Tuple
 import sys
 
-from merkle.node import MerkleNode
-from utils.hash_utils import hash_data, hash_pair, hash_review, bytes_to_hex, hex_to_bytes
+from utils.hash_utils import hash_data, hash_many, hash_pair, hash_pairs, hash_review, bytes_to_hex, hex_to_bytes
+
+# Items per task when leaf hashing is spread across worker processes
+# (a power of two, so chunks of whole leaf blocks stay aligned)
+LEAF_CHUNK_SIZE = 16384
+
+# Size of a SHA-256 digest, i.e. of one leaf in the leaf buffer
+HASH_SIZE = 32
+
+
+def _hash_chunk(data_items: List[Any]) -> bytes:
+    """
+    Hash a chunk of items in a worker process.
+
+    Digests are returned packed back to back in one bytes object, which
+    is much cheaper to send between processes than a list of 32-byte
+    objects.
+
+    Args:
+        data_items: Chunk of data items
+
+    Returns:
+        Concatenated 32-byte leaf hashes
+    """
+    return b''.join(MerkleTree.hash_leaves(data_items))
+
+
+def _build_chunk(data_items: List[Any], height: int) -> Tuple[bytes, bytes]:
+    """
+    Hash a chunk of items and reduce its leaf blocks in a worker process.
+
+    The chunk must start on a block boundary, so every block it holds
+    is complete apart from the tree's last one.
+
+    Args:
+        data_items: Chunk of data items
+        height: Block height of the tree being built
+
+    Returns:
+        Tuple of (packed leaf hashes, packed cached-layer node hashes)
+    """
+    leaf_hashes = MerkleTree.hash_leaves(data_items)
+    nodes = MerkleTree._reduce_blocks(leaf_hashes, height)
+    return b''.join(leaf_hashes), b''.join(nodes)
 
 
 class MerkleTree:
     """
     Merkle Tree with hybrid storage for memory efficiency.
 
-    Stores only root hash + leaf hashes after construction.
-    Intermediate nodes are discarded to save memory.
+    Stores only root hash + leaf hashes after construction, the leaves
+    packed back to back in a single bytearray. Intermediate nodes are
+    discarded to save memory.
 
     Memory usage: ~32MB for 1M records (32 bytes per leaf hash)
     """
 
-    def __init__(self, data_items: List[Any]):
+    def __init__(self, data_items: List[Any], workers: int = 1):
         """
         Initialize and build Merkle tree from data items.
 
@@ -38,6 +84,7 @@ class MerkleTree:
             data_items: List of data items (can be strings or dicts)
                        - If dict with review fields: hashed using hash_review()
                        - If string: hashed using hash_data()
+            workers: Number of processes for hashing and reducing leaf blocks
 
         Example:
             >>> reviews = [{"reviewerID": "A123", ...}, {...}]
@@ -49,79 +96,232 @@ class MerkleTree:
 
         self._leaf_count = len(data_items)
         self._root_hash: Optional[bytes] = None
-        self._leaf_hashes: List[bytes] = []
+        self._root_hex: Optional[str] = None
+        self._leaf_buffer = bytearray()
+        self._cached_layer: Optional[List[bytes]] = None
 
         # Build tree and extract what we need
-        self._build_tree(data_items)
+        self._build_tree(data_items, workers)
 
-    def _build_tree(self, data_items: List[Any]) -> None:
+    def _build_tree(self, data_items: List[Any], workers: int = 1) -> None:
         """
-        Build complete Merkle tree and extract root + leaf hashes.
+        Build Merkle tree and extract root + leaf hashes.
 
         Process:
-        1. Create leaf nodes from data items
-        2. Build tree bottom-up with parent nodes
-        3. Extract root hash and leaf hashes
-        4. Discard intermediate nodes (garbage collected)
+        1. Hash data items and pack the digests into the leaf buffer
+        2. Reduce each leaf block up to the cached layer
+        3. Reduce the cached layer up to the root hash
+
+        Only hash bytes are created; no node objects are allocated, so
+        the build is bound by hashlib.sha256 (OpenSSL, SHA-NI when the
+        CPU has it) rather than Python object overhead.
+
+        Leaf blocks are independent, so with workers > 1 steps 1-2 run
+        in worker processes, each taking a chunk of whole blocks.
 
         Args:
             data_items: List of data to build tree from
+            workers: Number of processes for steps 1-2
         """
-        # Step 1: Create leaf nodes
-        leaves = []
-        for i, item in enumerate(data_items):
-            # Hash the data
-            if isinstance(item, dict):
-                # Assume it's a review dict
-                leaf_hash = hash_review(item)
-            elif isinstance(item, str):
-                leaf_hash = hash_data(item)
-            else:
-                # Convert to string and hash
-                leaf_hash = hash_data(str(item))
-
-            # Create leaf node
-            leaf_node = MerkleNode(
-                hash_value=leaf_hash,
-                data=item if isinstance(item, str) else None,
-                index=i
-            )
-            leaves.append(leaf_node)
-
-        # Store leaf hashes (HYBRID STORAGE: keep leaves)
-        self._leaf_hashes = [leaf.hash for leaf in leaves]
-
-        # Step 2: Build tree bottom-up
-        current_level = leaves
-
-        while len(current_level) > 1:
-            next_level = []
-
-            # Process pairs
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-
-                # If odd number, duplicate last node
-                if i + 1 >= len(current_level):
-                    right = current_level[i]  # Duplicate (same object reference is fine)
-                else:
-                    right = current_level[i + 1]
-
-                # Create parent node with combined hash
-                parent_hash = hash_pair(left.hash, right.hash)
-                parent = MerkleNode(
-                    hash_value=parent_hash,
-                    left=left,
-                    right=right
-                )
-                next_level.append(parent)
-
-            current_level = next_level
-
-        # Step 3: Extract root hash (HYBRID STORAGE: keep root only)
-        if current_level:
-            self._root_hash = current_level[0].hash
-        # After this, current_level and all intermediate nodes are garbage collected
+        if workers > 1 and len(data_items) > LEAF_CHUNK_SIZE:
+            self._build_blocks_parallel(data_items, workers)
+        else:
+            # Step 1: Hash leaves (HYBRID STORAGE: keep leaves)
+            leaf_hashes = self.hash_leaves(data_items)
+            self._leaf_buffer = bytearray(b''.join(leaf_hashes))
+
+            # Step 2: Build blocks up to the cached layer
+            self._cached_layer = self._build_cached_layer(leaf_hashes)
+
+        # Step 3: Reduce the cached layer up to the root
+        self._root_hash = self._reduce(self._cached_layer)
+
+    def _build_blocks_parallel(self, data_items: List[Any], workers: int) -> None:
+        """
+        Hash leaves and build the cached layer in worker processes.
+
+        Chunks hold a power-of-two number of items at least as large as
+        a block, so chunk boundaries are block boundaries and each
+        worker returns finished cached-layer nodes. Only packed bytes
+        cross between processes.
+
+        Args:
+            data_items: List of data to build tree from
+            workers: Number of worker processes
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        height = self._block_height()
+        chunk_size = max(LEAF_CHUNK_SIZE, 1 << height)
+        chunks = [data_items[i:i + chunk_size]
+                  for i in range(0, len(data_items), chunk_size)]
+
+        packed_leaves: List[bytes] = []
+        packed_nodes: List[bytes] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for leaves, nodes in executor.map(_build_chunk, chunks, [height] * len(chunks)):
+                packed_leaves.append(leaves)
+                packed_nodes.append(nodes)
+
+        self._leaf_buffer = bytearray(b''.join(packed_leaves))
+        nodes = b''.join(packed_nodes)
+        self._cached_layer = [nodes[i:i + HASH_SIZE] for i in range(0, len(nodes), HASH_SIZE)]
+
+    @staticmethod
+    def _hash_item(item: Any) -> bytes:
+        """
+        Hash a single data item into a leaf hash.
+
+        Leaf hashes are deliberately not memoized by review identity:
+        records can be edited in place, and a cached hash would hide the
+        change. Reuse hashes explicitly via from_leaf_hashes() or
+        update_leaf() instead.
+
+        Args:
+            item: Review dict, string, or any object with a str() form
+
+        Returns:
+            32-byte SHA-256 leaf hash
+        """
+        if isinstance(item, dict):
+            # Assume it's a review dict
+            return hash_review(item)
+        elif isinstance(item, str):
+            return hash_data(item)
+        else:
+            # Convert to string and hash
+            return hash_data(str(item))
+
+    @staticmethod
+    def _next_level(level: List[bytes]) -> List[bytes]:
+        """
+        Hash a level of nodes into the level above.
+
+        An odd last node is paired with itself. hash_pairs() stops before
+        it, so its parent is appended on its own instead of copying the
+        whole level to duplicate it.
+
+        Args:
+            level: Non-empty list of node hashes
+
+        Returns:
+            List of (len(level) + 1) // 2 parent hashes
+        """
+        parents = hash_pairs(level)
+        if len(level) % 2:
+            parents.append(hash_pair(level[-1], level[-1]))
+        return parents
+
+    @staticmethod
+    def _reduce(level: List[bytes], levels: Optional[int] = None) -> bytes:
+        """
+        Hash a level of nodes upward until one node remains.
+
+        Odd levels duplicate their last node. When levels is given, exactly
+        that many rounds are applied, so a single node keeps being paired
+        with itself - this matches how a block's last node is treated
+        inside a larger tree.
+
+        Args:
+            level: Node hashes to reduce
+            levels: Number of rounds to apply (default: until one node)
+
+        Returns:
+            Hash of the resulting node
+        """
+        remaining = levels
+        while len(level) > 1 if remaining is None else remaining > 0:
+            level = MerkleTree._next_level(level)
+            if remaining is not None:
+                remaining -= 1
+        return level[0]
+
+    def _block_height(self) -> int:
+        """
+        Get the tree level held by the cached layer.
+
+        The cached layer sits halfway up the tree, so both a leaf block
+        (2**height leaves) and the cached layer hold about sqrt(N) nodes.
+
+        Returns:
+            Number of levels between the leaves and the cached layer
+        """
+        depth = (self._leaf_count - 1).bit_length()
+        return depth // 2
+
+    def _leaf_range(self, start: int, stop: int) -> List[bytes]:
+        """
+        Unpack a run of leaf hashes from the leaf buffer.
+
+        Args:
+            start: Index of the first leaf
+            stop: Index past the last leaf (clamped to the leaf count)
+
+        Returns:
+            List of 32-byte leaf hashes
+        """
+        # One copy out of the bytearray, then slicing yields bytes directly
+        packed = bytes(self._leaf_buffer[start * HASH_SIZE:stop * HASH_SIZE])
+        return [packed[i:i + HASH_SIZE] for i in range(0, len(packed), HASH_SIZE)]
+
+    def _build_block(self, block: int) -> bytes:
+        """
+        Rebuild one cached-layer node from its block of leaves.
+
+        Args:
+            block: Index of the block in the cached layer
+
+        Returns:
+            Hash of the block's subtree root
+        """
+        height = self._block_height()
+        size = 1 << height
+        start = block * size
+        return self._reduce(self._leaf_range(start, start + size), height)
+
+    def _build_cached_layer(self, leaf_hashes: Optional[List[bytes]] = None) -> List[bytes]:
+        """
+        Build the cached layer from all leaf hashes.
+
+        Args:
+            leaf_hashes: All leaf hashes as a list, if the caller already
+                         has one (default: unpacked from the leaf buffer)
+
+        Returns:
+            List of cached-layer node hashes
+        """
+        if leaf_hashes is None:
+            leaf_hashes = self._leaf_range(0, self._leaf_count)
+        return self._reduce_blocks(leaf_hashes, self._block_height())
+
+    @staticmethod
+    def _reduce_blocks(leaf_hashes: List[bytes], height: int) -> List[bytes]:
+        """
+        Reduce consecutive blocks of 2**height leaves to one node each.
+
+        Args:
+            leaf_hashes: Leaf hashes, starting on a block boundary
+            height: Block height
+
+        Returns:
+            List of cached-layer node hashes, one per block
+        """
+        size = 1 << height
+        return [MerkleTree._reduce(leaf_hashes[start:start + size], height)
+                for start in range(0, len(leaf_hashes), size)]
+
+    def _get_cached_layer(self) -> List[bytes]:
+        """
+        Get the cached layer, building it on first use.
+
+        Trees restored with from_dict() build it lazily.
+
+        Returns:
+            List of cached-layer node hashes
+        """
+        if self._cached_layer is None:
+            self._cached_layer = self._build_cached_layer()
+        return self._cached_layer
 
     def get_root_hash(self) -> bytes:
         """
@@ -153,7 +353,10 @@ class MerkleTree:
             >>> print(root_hex)
             'a1b2c3d4...'
         """
-        return bytes_to_hex(self.get_root_hash())
+        # Encoded once per root; reset whenever the root changes
+        if self._root_hex is None:
+            self._root_hex = bytes_to_hex(self.get_root_hash())
+        return self._root_hex
 
     def get_leaf_count(self) -> int:
         """
@@ -183,9 +386,10 @@ class MerkleTree:
             >>> len(leaf_hash)
             32
         """
-        if index < 0 or index >= len(self._leaf_hashes):
-            raise IndexError(f"Leaf index {index} out of range [0, {len(self._leaf_hashes)})")
-        return self._leaf_hashes[index]
+        if index < 0 or index >= self._leaf_count:
+            raise IndexError(f"Leaf index {index} out of range [0, {self._leaf_count})")
+        offset = index * HASH_SIZE
+        return bytes(self._leaf_buffer[offset:offset + HASH_SIZE])
 
     def get_all_leaf_hashes(self) -> List[bytes]:
         """
@@ -200,7 +404,25 @@ class MerkleTree:
             >>> len(leaves)
             3
         """
-        return self._leaf_hashes.copy()
+        return self._leaf_range(0, self._leaf_count)
+
+    def get_packed_leaf_hashes(self) -> bytes:
+        """
+        Get all leaf hashes packed back to back in one bytes object.
+
+        A single copy of the leaf buffer, without creating a bytes object
+        per leaf - use this when the hashes go to a file or another
+        buffer consumer. Leaf i is at [32 * i, 32 * (i + 1)).
+
+        Returns:
+            Concatenated 32-byte leaf hashes
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c"])
+            >>> len(tree.get_packed_leaf_hashes())
+            96
+        """
+        return bytes(self._leaf_buffer)
 
     def verify_data_in_tree(self, data: Any, index: int) -> bool:
         """
@@ -220,7 +442,7 @@ class MerkleTree:
             >>> tree.verify_data_in_tree("wrong", 0)
             False
         """
-        if index < 0 or index >= len(self._leaf_hashes):
+        if index < 0 or index >= self._leaf_count:
             return False
 
         # Hash the data
@@ -232,15 +454,54 @@ class MerkleTree:
             data_hash = hash_data(str(data))
 
         # Compare with stored leaf hash
-        return data_hash == self._leaf_hashes[index]
+        offset = index * HASH_SIZE
+        return data_hash == self._leaf_buffer[offset:offset + HASH_SIZE]
+
+    def diff_leaves(self, other: 'MerkleTree') -> List[int]:
+        """
+        Find positions where this tree and another hold different leaves.
+
+        Only positions present in both trees are compared. Equal roots and
+        sizes mean no differences at all; otherwise the packed leaf
+        buffers are compared a block at a time, and only blocks that
+        differ are scanned leaf by leaf, so a few edits cost O(sqrt(n))
+        Python steps plus a memcmp over the buffers.
+
+        Args:
+            other: Tree to compare against
+
+        Returns:
+            Sorted list of leaf indices whose hashes differ
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c"])
+            >>> tree.diff_leaves(tree.with_leaf_replaced(1, "x"))
+            [1]
+        """
+        if self._leaf_count == other._leaf_count and self._root_hash == other._root_hash:
+            return []
+
+        mine = self._leaf_buffer
+        theirs = other._leaf_buffer
+        end = min(self._leaf_count, other._leaf_count) * HASH_SIZE
+        step = HASH_SIZE << self._block_height()
+
+        diffs = []
+        for offset in range(0, end, step):
+            stop = min(offset + step, end)
+            if mine[offset:stop] != theirs[offset:stop]:
+                diffs.extend(i // HASH_SIZE for i in range(offset, stop, HASH_SIZE)
+                             if mine[i:i + HASH_SIZE] != theirs[i:i + HASH_SIZE])
+        return diffs
 
     def get_proof(self, index: int, data: Optional[Any] = None) -> 'MerkleProof':
         """
         Generate a Merkle proof for a leaf at the given index.
 
-        This method rebuilds the tree path on demand from stored leaf hashes,
-        collecting sibling hashes along the way. This is the hybrid storage
-        trade-off: we save memory but pay a small cost during proof generation.
+        This method rebuilds the tree path on demand from the leaf block
+        containing the index and the cached layer, collecting sibling hashes
+        along the way. This is the hybrid storage trade-off: we save memory
+        but pay a small cost during proof generation.
 
         Args:
             index: Index of the leaf to prove (0-based)
@@ -252,8 +513,8 @@ class MerkleTree:
         Raises:
             IndexError: If index is out of range
 
-        Time complexity: O(n) for rebuild + O(log n) for path = O(n)
-        Space complexity: O(n) for temporary tree + O(log n) for path
+        Time complexity: O(sqrt(n)) for one leaf block + the cached layer
+        Space complexity: O(sqrt(n)) for temporary levels + O(log n) for path
 
         Example:
             >>> tree = MerkleTree(["data1", "data2", "data3", "data4"])
@@ -265,53 +526,19 @@ class MerkleTree:
         from merkle.proof import MerkleProof
 
         # Validate index
-        if index < 0 or index >= len(self._leaf_hashes):
-            raise IndexError(f"Leaf index {index} out of range [0, {len(self._leaf_hashes)})")
-
-        # Start with leaf hashes as the current level
-        current_level = self._leaf_hashes.copy()
-        target_index = index
-        proof_path: List[Tuple[bytes, bool]] = []
-
-        # Rebuild tree bottom-up, tracking the target and collecting siblings
-        while len(current_level) > 1:
-            next_level = []
-
-            # Process pairs to build parent level
-            for i in range(0, len(current_level), 2):
-                left_hash = current_level[i]
-
-                # Handle odd number of nodes (duplicate last)
-                if i + 1 >= len(current_level):
-                    right_hash = current_level[i]
-                else:
-                    right_hash = current_level[i + 1]
-
-                # Check if our target is in this pair
-                if i == target_index or i + 1 == target_index:
-                    # Record the sibling
-                    if target_index == i:
-                        # Target is on the left, sibling is on the right
-                        sibling_hash = right_hash
-                        is_left = False  # Sibling is on the right
-                    else:
-                        # Target is on the right, sibling is on the left
-                        sibling_hash = left_hash
-                        is_left = True  # Sibling is on the left
-
-                    proof_path.append((sibling_hash, is_left))
-
-                # Create parent hash
-                parent_hash = hash_pair(left_hash, right_hash)
-                next_level.append(parent_hash)
-
-            # Move to next level
-            current_level = next_level
-            # Update target index for parent level
-            target_index = target_index // 2
-
-        # At this point, current_level should contain only the root hash
-        # and we've collected all siblings along the path
+        if index < 0 or index >= self._leaf_count:
+            raise IndexError(f"Leaf index {index} out of range [0, {self._leaf_count})")
+
+        height = self._block_height()
+        size = 1 << height
+        block = index >> height
+        start = block << height
+
+        # Collect siblings inside the leaf block, then across the cached layer
+        proof_path = self._path_from_levels(
+            self._build_levels(self._leaf_range(start, start + size), height), index - start)
+        proof_path.extend(self._path_from_levels(
+            self._build_levels(self._get_cached_layer()), block))
 
         # Create and return the proof
         return MerkleProof(
@@ -321,10 +548,345 @@ class MerkleTree:
             root_hash=self._root_hash
         )
 
+    @staticmethod
+    def _build_levels(level: List[bytes], levels: Optional[int] = None) -> List[List[bytes]]:
+        """
+        Reduce a level of nodes, keeping every intermediate level.
+
+        Args:
+            level: Node hashes at the starting level
+            levels: Number of rounds to apply (default: until one node)
+
+        Returns:
+            List of levels, starting with the given one
+        """
+        result = [level]
+        remaining = levels
+        while len(level) > 1 if remaining is None else remaining > 0:
+            level = MerkleTree._next_level(level)
+            result.append(level)
+            if remaining is not None:
+                remaining -= 1
+        return result
+
+    @staticmethod
+    def _path_from_levels(levels: List[List[bytes]], index: int) -> List[Tuple[bytes, bool]]:
+        """
+        Read a proof path out of prebuilt levels.
+
+        Args:
+            levels: Levels from _build_levels()
+            index: Position of the target node in the first level
+
+        Returns:
+            Proof path as (sibling_hash, is_left) tuples
+        """
+        path: List[Tuple[bytes, bool]] = []
+        for level in levels[:-1]:
+            if index % 2:
+                path.append((level[index - 1], True))
+            else:
+                # Last node of an odd level is paired with itself
+                sibling = index + 1 if index + 1 < len(level) else index
+                path.append((level[sibling], False))
+            index //= 2
+        return path
+
+    def get_proofs(self, indices: List[int],
+                   data_items: Optional[List[Any]] = None) -> List['MerkleProof']:
+        """
+        Generate Merkle proofs for many leaves at once.
+
+        The cached layer's levels are built once, and each leaf block
+        once no matter how many of the requested indices fall in it, so
+        every proof after that is only list lookups.
+
+        Args:
+            indices: Leaf indices to prove (0-based)
+            data_items: Optional data for each index, aligned with indices
+
+        Returns:
+            List of MerkleProof objects, in the order of indices
+
+        Raises:
+            IndexError: If any index is out of range
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c", "d"])
+            >>> proofs = tree.get_proofs([0, 3], ["a", "d"])
+            >>> all(p.verify() for p in proofs)
+            True
+        """
+        from merkle.proof import MerkleProof
+
+        for index in indices:
+            if index < 0 or index >= self._leaf_count:
+                raise IndexError(f"Leaf index {index} out of range [0, {self._leaf_count})")
+
+        height = self._block_height()
+        size = 1 << height
+        layer_levels = self._build_levels(self._get_cached_layer())
+        block_levels: Dict[int, List[List[bytes]]] = {}
+
+        proofs = []
+        for n, index in enumerate(indices):
+            block = index >> height
+            if block not in block_levels:
+                start = block << height
+                block_levels[block] = self._build_levels(
+                    self._leaf_range(start, start + size), height)
+
+            proof_path = self._path_from_levels(block_levels[block], index & (size - 1))
+            proof_path.extend(self._path_from_levels(layer_levels, block))
+
+            proofs.append(MerkleProof(
+                leaf_data=data_items[n] if data_items is not None else None,
+                leaf_index=index,
+                proof_path=proof_path,
+                root_hash=self._root_hash
+            ))
+        return proofs
+
+    def get_proofs_range(self, start: int, end: int,
+                         data_items: Optional[List[Any]] = None) -> List['MerkleProof']:
+        """
+        Generate Merkle proofs for a contiguous range of leaves.
+
+        Blocks are visited in order, so each block's levels are built
+        once and dropped as soon as the range moves past it, and the
+        cached-layer part of the path is shared by every leaf in a block.
+
+        Args:
+            start: Index of the first leaf to prove (0-based)
+            end: Index past the last leaf to prove
+            data_items: Optional data for each leaf, aligned with the range
+                        (data_items[0] belongs to leaf start)
+
+        Returns:
+            List of MerkleProof objects for leaves start..end-1
+
+        Raises:
+            IndexError: If the range is not within [0, leaf count]
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c", "d"])
+            >>> proofs = tree.get_proofs_range(1, 3, ["b", "c"])
+            >>> all(p.verify() for p in proofs)
+            True
+        """
+        from merkle.proof import MerkleProof
+
+        if start < 0 or end > self._leaf_count or start > end:
+            raise IndexError(f"Leaf range [{start}, {end}) out of range [0, {self._leaf_count})")
+        if start == end:
+            return []
+
+        height = self._block_height()
+        size = 1 << height
+        layer_levels = self._build_levels(self._get_cached_layer())
+
+        proofs = []
+        for block in range(start >> height, (end + size - 1) >> height):
+            block_start = block << height
+            block_levels = self._build_levels(
+                self._leaf_range(block_start, block_start + size), height)
+            layer_path = self._path_from_levels(layer_levels, block)
+
+            for index in range(max(start, block_start), min(end, block_start + size)):
+                proof_path = self._path_from_levels(block_levels, index - block_start)
+                proof_path.extend(layer_path)
+
+                proofs.append(MerkleProof(
+                    leaf_data=data_items[index - start] if data_items is not None else None,
+                    leaf_index=index,
+                    proof_path=proof_path,
+                    root_hash=self._root_hash
+                ))
+        return proofs
+
+    def update_leaf(self, index: int, data: Any) -> None:
+        """
+        Replace the data at a leaf and update the root incrementally.
+
+        Only the leaf's block and the cached layer are rehashed, and
+        nothing at all if the new data hashes to the current leaf.
+
+        Args:
+            index: Index of the leaf to replace (0-based)
+            data: New data item (string or dict)
+
+        Raises:
+            IndexError: If index is out of range
+
+        Time complexity: O(sqrt(n))
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c"])
+            >>> tree.update_leaf(1, "x")
+            >>> tree.get_root_hash() == MerkleTree(["a", "x", "c"]).get_root_hash()
+            True
+        """
+        if index < 0 or index >= self._leaf_count:
+            raise IndexError(f"Leaf index {index} out of range [0, {self._leaf_count})")
+
+        leaf_hash = self._hash_item(data)
+        offset = index * HASH_SIZE
+        if self._leaf_buffer[offset:offset + HASH_SIZE] == leaf_hash:
+            # Same content as before (e.g. a record re-saved unchanged)
+            return
+
+        layer = self._get_cached_layer()
+        self._leaf_buffer[offset:offset + HASH_SIZE] = leaf_hash
+
+        block = index >> self._block_height()
+        layer[block] = self._build_block(block)
+        self._root_hash = self._reduce(layer)
+        self._root_hex = None
+
+    def append_leaf(self, data: Any) -> None:
+        """
+        Append a data item as a new leaf and update the root incrementally.
+
+        Only the last block and the cached layer are rehashed, unless the
+        tree grows past a power of two and the cached layer moves up a level.
+
+        Args:
+            data: New data item (string or dict)
+
+        Example:
+            >>> tree = MerkleTree(["a", "b"])
+            >>> tree.append_leaf("c")
+            >>> tree.get_root_hash() == MerkleTree(["a", "b", "c"]).get_root_hash()
+            True
+        """
+        old_height = self._block_height()
+        layer = self._get_cached_layer()
+
+        self._leaf_buffer += self._hash_item(data)
+        self._leaf_count += 1
+
+        height = self._block_height()
+        if height != old_height:
+            layer = self._cached_layer = self._build_cached_layer()
+        else:
+            block = (self._leaf_count - 1) >> height
+            if block == len(layer):
+                layer.append(self._build_block(block))
+            else:
+                layer[block] = self._build_block(block)
+
+        self._root_hash = self._reduce(layer)
+        self._root_hex = None
+
+    def remove_leaf(self, index: int) -> None:
+        """
+        Remove a leaf and update the root from the stored leaf hashes.
+
+        Every later leaf shifts down one position, so all blocks from the
+        removed leaf's block onward are rehashed, but no data item is
+        hashed again. Blocks before it are reused unless the tree shrinks
+        past a power of two and the cached layer moves down a level.
+
+        Args:
+            index: Index of the leaf to remove (0-based)
+
+        Raises:
+            IndexError: If index is out of range
+            ValueError: If the leaf is the only one in the tree
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c"])
+            >>> tree.remove_leaf(1)
+            >>> tree.get_root_hash() == MerkleTree(["a", "c"]).get_root_hash()
+            True
+        """
+        if index < 0 or index >= self._leaf_count:
+            raise IndexError(f"Leaf index {index} out of range [0, {self._leaf_count})")
+        if self._leaf_count == 1:
+            raise ValueError("Cannot remove the only leaf of a Merkle tree")
+
+        old_height = self._block_height()
+        layer = self._get_cached_layer()
+
+        offset = index * HASH_SIZE
+        del self._leaf_buffer[offset:offset + HASH_SIZE]
+        self._leaf_count -= 1
+
+        height = self._block_height()
+        if height != old_height:
+            layer = self._cached_layer = self._build_cached_layer()
+        else:
+            first = index >> height
+            size = 1 << height
+            block_count = (self._leaf_count + size - 1) // size
+            del layer[first:]
+            layer.extend(self._build_block(b) for b in range(first, block_count))
+
+        self._root_hash = self._reduce(layer)
+        self._root_hex = None
+
+    def copy(self) -> 'MerkleTree':
+        """
+        Create an independent copy of the tree.
+
+        Copies the leaf buffer and the cached layer list; cached-layer
+        hashes are immutable bytes and are shared.
+
+        Returns:
+            New MerkleTree with the same state
+        """
+        tree = self.__class__.__new__(self.__class__)
+        tree._root_hash = self._root_hash
+        tree._root_hex = self._root_hex
+        tree._leaf_buffer = self._leaf_buffer.copy()
+        tree._leaf_count = self._leaf_count
+        tree._cached_layer = None if self._cached_layer is None else self._cached_layer.copy()
+        return tree
+
+    def with_leaf_replaced(self, index: int, data: Any) -> 'MerkleTree':
+        """
+        Get a new tree with one leaf replaced, leaving this tree unchanged.
+
+        Args:
+            index: Index of the leaf to replace (0-based)
+            data: New data item (string or dict)
+
+        Returns:
+            New MerkleTree reflecting the replacement
+
+        Example:
+            >>> tree = MerkleTree(["a", "b", "c"])
+            >>> tampered = tree.with_leaf_replaced(0, "x")
+            >>> tampered.get_root_hash() != tree.get_root_hash()
+            True
+        """
+        tree = self.copy()
+        tree.update_leaf(index, data)
+        return tree
+
+    def with_leaf_appended(self, data: Any) -> 'MerkleTree':
+        """
+        Get a new tree with one leaf appended, leaving this tree unchanged.
+
+        Args:
+            data: New data item (string or dict)
+
+        Returns:
+            New MerkleTree reflecting the insertion
+        """
+        tree = self.copy()
+        tree.append_leaf(data)
+        return tree
+
     def get_memory_usage(self) -> Dict[str, Any]:
         """
         Get memory usage statistics for the tree.
 
+        total_bytes covers the root hash and the packed leaf storage,
+        which grows linearly with the leaf count. The cached middle layer
+        (about sqrt(N) nodes) is reported on its own as cached_layer_bytes
+        and is not part of the total.
+
         Returns:
             Dictionary with memory usage information
 
@@ -334,10 +896,15 @@ class MerkleTree:
             >>> print(stats['total_mb'])
             0.032  # ~32KB for 1000 leaves
         """
-        # Calculate sizes
+        # Calculate sizes; leaves are exactly 32 bytes each in one buffer
         root_size = sys.getsizeof(self._root_hash) if self._root_hash else 0
-        leaves_size = sum(sys.getsizeof(h) for h in self._leaf_hashes)
-        list_overhead = sys.getsizeof(self._leaf_hashes)
+        leaves_size = len(self._leaf_buffer)
+        list_overhead = sys.getsizeof(self._leaf_buffer) - leaves_size
+
+        # Middle layer nodes are separate bytes objects, only counted once built
+        layer = self._cached_layer
+        layer_size = (sys.getsizeof(layer) + sum(map(sys.getsizeof, layer))
+                      if layer is not None else 0)
 
         total_bytes = root_size + leaves_size + list_overhead
 
@@ -346,6 +913,7 @@ class MerkleTree:
             'root_hash_bytes': root_size,
             'leaf_hashes_bytes': leaves_size,
             'list_overhead_bytes': list_overhead,
+            'cached_layer_bytes': layer_size,
             'total_bytes': total_bytes,
             'total_kb': total_bytes / 1024,
             'total_mb': total_bytes / (1024 * 1024),
@@ -365,9 +933,12 @@ class MerkleTree:
             >>> 'root_hash' in tree_dict
             True
         """
+        # Hex-encode the packed leaf buffer once, then cut it per leaf
+        leaf_hex = bytes_to_hex(self._leaf_buffer)
+        step = HASH_SIZE * 2
         return {
             'root_hash': bytes_to_hex(self._root_hash),
-            'leaf_hashes': [bytes_to_hex(h) for h in self._leaf_hashes],
+            'leaf_hashes': [leaf_hex[i:i + step] for i in range(0, len(leaf_hex), step)],
             'leaf_count': self._leaf_count
         }
 
@@ -394,11 +965,88 @@ class MerkleTree:
 
         # Restore from dict
         tree._root_hash = hex_to_bytes(data['root_hash'])
-        tree._leaf_hashes = [hex_to_bytes(h) for h in data['leaf_hashes']]
+        tree._root_hex = None
+        tree._leaf_buffer = bytearray(hex_to_bytes(''.join(data['leaf_hashes'])))
         tree._leaf_count = data['leaf_count']
+        tree._cached_layer = None
 
         return tree
 
+    @classmethod
+    def from_leaf_hashes(cls, leaf_hashes: List[bytes]) -> 'MerkleTree':
+        """
+        Build a tree directly from precomputed leaf hashes.
+
+        Skips record hashing, so variants of a dataset (e.g. with one
+        record tampered) can be built from a shared list of leaf hashes
+        by replacing only the entries that differ.
+
+        Args:
+            leaf_hashes: List of 32-byte leaf hashes
+
+        Returns:
+            MerkleTree instance
+
+        Raises:
+            ValueError: If leaf_hashes is empty
+
+        Example:
+            >>> leaves = MerkleTree.hash_leaves(["a", "b"])
+            >>> tree = MerkleTree.from_leaf_hashes(leaves)
+            >>> tree.get_root_hash() == MerkleTree(["a", "b"]).get_root_hash()
+            True
+        """
+        if not leaf_hashes:
+            raise ValueError("Cannot create Merkle tree from empty data")
+
+        tree = cls.__new__(cls)
+        tree._leaf_buffer = bytearray(b''.join(leaf_hashes))
+        tree._leaf_count = len(leaf_hashes)
+        tree._cached_layer = tree._build_cached_layer(list(leaf_hashes))
+        tree._root_hash = tree._reduce(tree._cached_layer)
+        tree._root_hex = None
+
+        return tree
+
+    @classmethod
+    def hash_leaves(cls, data_items: List[Any], workers: int = 1) -> List[bytes]:
+        """
+        Hash data items into leaf hashes without building a tree.
+
+        Leaves are independent, so with workers > 1 the items are split
+        into chunks of LEAF_CHUNK_SIZE and hashed in separate processes.
+        Threads would not help: hashlib holds the GIL for inputs this
+        small, and canonicalizing reviews is pure Python.
+
+        Args:
+            data_items: List of data items (strings or dicts)
+            workers: Number of worker processes (1 hashes in-process)
+
+        Returns:
+            List of 32-byte leaf hashes, one per item
+
+        Example:
+            >>> leaves = MerkleTree.hash_leaves(reviews, workers=os.cpu_count())
+        """
+        if workers <= 1 or len(data_items) <= LEAF_CHUNK_SIZE:
+            if all(type(item) is str for item in data_items):
+                return hash_many(data_items)
+            # Reviews go straight to hash_review(); the per-item call
+            # through _hash_item() is a measurable share of leaf hashing
+            hash_item = cls._hash_item
+            return [hash_review(item) if type(item) is dict else hash_item(item)
+                    for item in data_items]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [data_items[i:i + LEAF_CHUNK_SIZE]
+                  for i in range(0, len(data_items), LEAF_CHUNK_SIZE)]
+        leaf_hashes: List[bytes] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for packed in executor.map(_hash_chunk, chunks):
+                leaf_hashes.extend(packed[i:i + 32] for i in range(0, len(packed), 32))
+        return leaf_hashes
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         root_preview = self.get_root_hash_hex()[:16] if self._root_hash else "None"
@@ -14,6 +14,7 @@ from performance.metrics import (
     ThroughputCalculator,
     PerformanceMetrics,
     PerformanceValidator,
+    Validation,
     measure_function,
     benchmark_iterations
 )
@@ -25,6 +26,7 @@ __all__ = [
     'ThroughputCalculator',
     'PerformanceMetrics',
     'PerformanceValidator',
+    'Validation',
     'measure_function',
     'benchmark_iterations',
     'MerkleTreeBenchmark'
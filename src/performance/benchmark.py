@@ -9,7 +9,9 @@ Validates all performance targets:
 - Hashing speed: >100K records/second
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import argparse
+import itertools
 import sys
 import json
 from pathlib import Path
@@ -19,16 +21,78 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from merkle.tree import MerkleTree
-from merkle.proof import MerkleProof
 from verification.integrity_checker import IntegrityChecker
 from verification.tamper_detector import TamperDetector
 from performance.metrics import (
     PerformanceTimer,
-    PerformanceMetrics,
+    MemoryTracker,
     PerformanceValidator,
-    MemoryTracker
+    Validation,
+    auto_iterations,
+    benchmark_iterations
 )
-from utils.hash_utils import hash_data
+from utils.hash_utils import hash_data, hash_many, hash_review, has_sha_extensions
+
+
+# Phases of the comprehensive benchmark that run once per dataset size
+SIZE_PHASES = ('construction', 'verification', 'proof_generation',
+               'proof_verification', 'memory', 'tamper_detection')
+
+
+def _benchmark_size(size: int, small: bool) -> Tuple[str, Dict[str, Any], List[Validation]]:
+    """
+    Run every per-size phase for one size in a worker process.
+
+    Module-level so worker processes can run it. Output is captured so
+    the parent can print each size's report in one piece.
+
+    Args:
+        size: Number of records
+        small: Whether to include the phases only run for small sizes
+
+    Returns:
+        Tuple of (printed output, results by phase, validation entries)
+    """
+    import io
+    from contextlib import redirect_stdout
+
+    bench = MerkleTreeBenchmark()
+    bench._warmup()
+    sizes = [size]
+    output = io.StringIO()
+    with redirect_stdout(output):
+        results = {
+            'construction': bench.benchmark_tree_construction(sizes),
+            'verification': bench.benchmark_root_hash_verification(sizes),
+            'proof_generation': bench.benchmark_proof_generation(sizes),
+            'proof_verification': bench.benchmark_proof_verification(sizes) if small else {},
+            'memory': bench.benchmark_memory_usage(sizes),
+            'tamper_detection': bench.benchmark_tamper_detection(sizes) if small else {}
+        }
+    return output.getvalue(), results, bench.validator.validations
+
+
+def run_construction_benchmark(sizes: List[int]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Benchmark tree construction with printed output captured.
+
+    Module-level so a background worker process can run it; sizes are
+    still built one after another inside that process, so the timings
+    are not skewed by sizes competing for the CPU.
+
+    Args:
+        sizes: List of dataset sizes to test
+
+    Returns:
+        Tuple of (printed output, construction results)
+    """
+    import io
+    from contextlib import redirect_stdout
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        results = MerkleTreeBenchmark().benchmark_tree_construction(sizes)
+    return output.getvalue(), results
 
 
 class MerkleTreeBenchmark:
@@ -42,6 +106,50 @@ class MerkleTreeBenchmark:
         """Initialize benchmark suite."""
         self.results: Dict[str, Any] = {}
         self.validator = PerformanceValidator()
+        # Test data and tree per size, shared by the read-only benchmarks
+        self._fixtures: Dict[int, Tuple[List[str], MerkleTree]] = {}
+        self._fixture_peaks: Dict[int, int] = {}
+
+    def _get_fixture(self, size: int,
+                     trace_memory: bool = False) -> Tuple[List[str], MerkleTree]:
+        """
+        Get test data and its tree for a size, building them only once.
+
+        Args:
+            size: Number of records
+            trace_memory: Build the tree under tracemalloc and record its
+                          peak heap in self._fixture_peaks. A tree built
+                          by the (untraced, timed) construction benchmark
+                          is replaced by the traced build, once per size.
+
+        Returns:
+            Tuple of (data, tree)
+        """
+        if trace_memory and size not in self._fixture_peaks:
+            data = [f"review_{i}" for i in range(size)]
+            with MemoryTracker.measure_peak() as memory:
+                tree = MerkleTree(data)
+            self._fixtures[size] = (data, tree)
+            self._fixture_peaks[size] = memory['peak_bytes']
+        elif size not in self._fixtures:
+            data = [f"review_{i}" for i in range(size)]
+            self._fixtures[size] = (data, MerkleTree(data))
+        return self._fixtures[size]
+
+    def _warmup(self) -> None:
+        """
+        Run the benchmarked code paths once on a small tree.
+
+        Results are discarded; this only keeps one-time costs (first
+        calls, first allocations, lazily built state) out of the timings
+        of the first size measured.
+        """
+        data = [f"warmup_{i}" for i in range(1000)]
+        tree = MerkleTree(data)
+        tree.get_proof(500, data[500]).verify()
+        tree.get_proofs([0, 999], [data[0], data[999]])
+        hash_many(data)
+        TamperDetector().detect_tampering(tree, MerkleTree.from_leaf_hashes(tree.get_all_leaf_hashes()))
 
     def benchmark_tree_construction(self, sizes: List[int]) -> Dict[str, Any]:
         """
@@ -71,6 +179,7 @@ class MerkleTreeBenchmark:
 
             time_ms = timer.get_elapsed_ms()
             time_seconds = timer.get_elapsed_seconds()
+            self._fixtures[size] = (data, tree)
 
             # Calculate throughput
             throughput = size / time_seconds if time_seconds > 0 else float('inf')
@@ -121,27 +230,34 @@ class MerkleTreeBenchmark:
         for size in sizes:
             print(f"  Testing with {size:,} records...")
 
-            # Create trees
-            data = [f"review_{i}" for i in range(size)]
-            tree1 = MerkleTree(data)
-            tree2 = MerkleTree(data)  # Identical tree
+            # Verifying a tree against its own baseline needs no rebuild
+            data, tree = self._get_fixture(size)
 
             # Measure verification time
             timer = PerformanceTimer()
             checker = IntegrityChecker()
 
             # Save baseline
-            checker.save_baseline(tree1, f"benchmark_{size}")
+            checker.save_baseline(tree, f"benchmark_{size}")
 
-            # Verify (this is the critical O(1) operation)
+            # Discarded first call, so the baseline load is not timed cold
+            checker.verify_integrity(tree, f"benchmark_{size}")
+
+            # Verify (this is the critical O(1) operation), repeated so the
+            # average is not dominated by timer noise
+            iterations = auto_iterations(
+                lambda: checker.verify_integrity(tree, f"benchmark_{size}"))
             with timer.measure():
-                result = checker.verify_integrity(tree2, f"benchmark_{size}")
+                for _ in range(iterations):
+                    result = checker.verify_integrity(tree, f"benchmark_{size}")
 
-            time_ms = timer.get_elapsed_ms()
+            time_ms = timer.get_elapsed_ms() / iterations
 
             results[f"verification_{size}"] = {
                 'size': size,
                 'time_ms': time_ms,
+                'time_ns': timer.get_elapsed_ns() // iterations,
+                'iterations': iterations,
                 'verified': result['verified']
             }
 
@@ -179,34 +295,39 @@ class MerkleTreeBenchmark:
         for size in sizes:
             print(f"  Testing with {size:,} records...")
 
-            # Create tree
-            data = [f"review_{i}" for i in range(size)]
-            tree = MerkleTree(data)
+            data, tree = self._get_fixture(size)
+            indices = [i * (size // proofs_per_size) for i in range(proofs_per_size)]
 
-            # Generate multiple proofs and measure
-            times = []
-            for i in range(proofs_per_size):
-                index = i * (size // proofs_per_size) if proofs_per_size > 0 else 0
+            # Each call generates the next proof in turn; the warm-up pass
+            # goes over the same proofs once, untimed, so average and range
+            # come from one sample of warm calls
+            proof_args = itertools.cycle([(i, data[i]) for i in indices])
+            stats = benchmark_iterations(
+                lambda: tree.get_proof(*next(proof_args)),
+                proofs_per_size, warmup=proofs_per_size)
 
-                timer = PerformanceTimer()
-                with timer.measure():
-                    proof = tree.get_proof(index, data[index])
-                times.append(timer.get_elapsed_ms())
+            avg_time = stats['avg_time_ms']
+            min_time = stats['min_time_ms']
+            max_time = stats['max_time_ms']
 
-            avg_time = sum(times) / len(times)
-            min_time = min(times)
-            max_time = max(times)
+            # Same proofs in one batch call, sharing rebuilt levels
+            timer = PerformanceTimer()
+            with timer.measure():
+                tree.get_proofs(indices, [data[i] for i in indices])
+            batch_avg_time = timer.get_elapsed_ms() / proofs_per_size
 
             results[f"proof_gen_{size}"] = {
                 'size': size,
                 'proofs_generated': proofs_per_size,
                 'avg_time_ms': avg_time,
                 'min_time_ms': min_time,
-                'max_time_ms': max_time
+                'max_time_ms': max_time,
+                'batch_avg_time_ms': batch_avg_time
             }
 
             print(f"    Average: {avg_time:.4f}ms per proof")
             print(f"    Range: {min_time:.4f}ms - {max_time:.4f}ms")
+            print(f"    Batched: {batch_avg_time:.4f}ms per proof")
 
             # Validate against target
             passed = self.validator.validate(
@@ -236,21 +357,26 @@ class MerkleTreeBenchmark:
         for size in sizes:
             print(f"  Testing with {size:,} records...")
 
-            # Create tree and proof
-            data = [f"review_{i}" for i in range(size)]
-            tree = MerkleTree(data)
+            # Create proof
+            data, tree = self._get_fixture(size)
             proof = tree.get_proof(size // 2, data[size // 2])
+            proof.verify()
 
-            # Measure verification time
+            # Measure verification time (after one discarded verify),
+            # averaged over enough repeats to rise above timer noise
+            iterations = auto_iterations(proof.verify)
             timer = PerformanceTimer()
             with timer.measure():
-                verified = proof.verify()
+                for _ in range(iterations):
+                    verified = proof.verify()
 
-            time_ms = timer.get_elapsed_ms()
+            time_ms = timer.get_elapsed_ms() / iterations
 
             results[f"proof_verify_{size}"] = {
                 'size': size,
                 'time_ms': time_ms,
+                'time_ns': timer.get_elapsed_ns() // iterations,
+                'iterations': iterations,
                 'verified': verified
             }
 
@@ -276,9 +402,10 @@ class MerkleTreeBenchmark:
         for size in sizes:
             print(f"  Testing with {size:,} records...")
 
-            # Create tree
-            data = [f"review_{i}" for i in range(size)]
-            tree = MerkleTree(data)
+            # Peak heap while building the fixture; its build is traced,
+            # so the tracing overhead stays out of the construction timings
+            data, tree = self._get_fixture(size, trace_memory=True)
+            peak_bytes = self._fixture_peaks[size]
 
             # Get memory stats
             stats = tree.get_memory_usage()
@@ -287,17 +414,21 @@ class MerkleTreeBenchmark:
                 'size': size,
                 'total_mb': stats['total_mb'],
                 'total_bytes': stats['total_bytes'],
-                'bytes_per_leaf': stats['bytes_per_leaf']
+                'bytes_per_leaf': stats['bytes_per_leaf'],
+                'peak_build_mb': peak_bytes / (1024 * 1024),
+                'peak_build_bytes': peak_bytes
             }
 
             print(f"    Total: {stats['total_mb']:.2f} MB")
             print(f"    Per leaf: {stats['bytes_per_leaf']:.2f} bytes")
+            print(f"    Peak during build: {peak_bytes / (1024 * 1024):.2f} MB")
 
-            # Validate against target for 1M records
+            # Validate against target for 1M records, using the build's
+            # peak since that is what must fit in memory
             if size >= 1_000_000:
                 passed = self.validator.validate(
                     f"Memory usage ({size:,} records)",
-                    stats['total_mb'],
+                    max(stats['total_mb'], peak_bytes / (1024 * 1024)),
                     500.0,
                     less_is_better=True,
                     unit="MB"
@@ -319,25 +450,33 @@ class MerkleTreeBenchmark:
         Performance Target: >100K hashes/second
         """
         print(f"\nBenchmarking hashing speed ({count:,} hashes)...")
+        sha_extensions = has_sha_extensions()
+        print(f"  CPU SHA extensions: {'available' if sha_extensions else 'not detected'}")
 
         # Generate test data
         data = [f"test_data_{i}" for i in range(count)]
 
-        # Measure hashing time
+        # Measure hashing time, as one batch call so that the timing is
+        # the SHA-256 primitive rather than a Python call per item
         timer = PerformanceTimer()
         with timer.measure():
-            for item in data:
-                hash_data(item)
+            digests = hash_many(data)
 
         time_ms = timer.get_elapsed_ms()
         time_seconds = timer.get_elapsed_seconds()
         throughput = count / time_seconds if time_seconds > 0 else float('inf')
 
+        # Sanity check the batch against the single-item hash
+        verified = (not data or
+                    (digests[0] == hash_data(data[0]) and digests[-1] == hash_data(data[-1])))
+
         results = {
             'count': count,
             'time_ms': time_ms,
             'time_seconds': time_seconds,
-            'throughput_per_sec': throughput
+            'throughput_per_sec': throughput,
+            'sha_extensions': sha_extensions,
+            'verified': verified
         }
 
         print(f"  Time: {time_seconds:.2f}s")
@@ -355,6 +494,52 @@ class MerkleTreeBenchmark:
 
         return results
 
+    def benchmark_review_hashing(self, count: int = 100_000) -> Dict[str, Any]:
+        """
+        Benchmark leaf preparation for review records.
+
+        Measures hash_review, i.e. canonical string building plus SHA-256,
+        which is the per-leaf cost of building a tree from real reviews.
+
+        Args:
+            count: Number of reviews to hash
+
+        Returns:
+            Review hashing benchmark results
+        """
+        print(f"\nBenchmarking review hashing ({count:,} reviews)...")
+
+        # Generate review-shaped test data
+        reviews = [
+            {
+                'reviewerID': f"A{i:013d}",
+                'asin': f"B{i % 10_000:09d}",
+                'overall': float(i % 5 + 1),
+                'unixReviewTime': 1_300_000_000 + i,
+                'reviewText': f"Review text {i} " * 10
+            }
+            for i in range(count)
+        ]
+
+        timer = PerformanceTimer()
+        with timer.measure():
+            for review in reviews:
+                hash_review(review)
+
+        time_ms = timer.get_elapsed_ms()
+        time_seconds = timer.get_elapsed_seconds()
+        throughput = count / time_seconds if time_seconds > 0 else float('inf')
+
+        print(f"  Time: {time_seconds:.2f}s")
+        print(f"  Throughput: {throughput:,.0f} reviews/sec")
+
+        return {
+            'count': count,
+            'time_ms': time_ms,
+            'time_seconds': time_seconds,
+            'throughput_per_sec': throughput
+        }
+
     def benchmark_tamper_detection(self, sizes: List[int]) -> Dict[str, Any]:
         """
         Benchmark tamper detection performance.
@@ -371,16 +556,14 @@ class MerkleTreeBenchmark:
         for size in sizes:
             print(f"  Testing with {size:,} records...")
 
-            # Create baseline and modified trees
-            baseline_data = [f"review_{i}" for i in range(size)]
-            modified_data = baseline_data.copy()
-            # Modify 1% of records
+            # The modified tree reuses the baseline's leaf hashes and only
+            # hashes the 1% of records that changed
+            baseline_data, baseline_tree = self._get_fixture(size)
+            modified_leaves = baseline_tree.get_all_leaf_hashes()
             for i in range(0, size, 100):
-                if i < len(modified_data):
-                    modified_data[i] = f"MODIFIED_{i}"
+                modified_leaves[i] = hash_data(f"MODIFIED_{i}")
 
-            baseline_tree = MerkleTree(baseline_data)
-            modified_tree = MerkleTree(modified_data)
+            modified_tree = MerkleTree.from_leaf_hashes(modified_leaves)
 
             # Measure detection time
             detector = TamperDetector()
@@ -401,10 +584,19 @@ class MerkleTreeBenchmark:
 
         return results
 
-    def run_comprehensive_benchmark(self) -> Dict[str, Any]:
+    def run_comprehensive_benchmark(self, workers: int = 1) -> Dict[str, Any]:
         """
         Run complete benchmark suite.
 
+        Sizes share nothing, so with workers > 1 every size runs its
+        phases in its own process; each worker's output is printed as
+        one piece, in size order. Hashing speed is size-independent and
+        always runs here. Parallel runs finish sooner, but sizes then
+        compete for the CPU and their timings include that contention.
+
+        Args:
+            workers: Number of worker processes (1 runs in-process)
+
         Returns:
             Complete benchmark results
         """
@@ -415,17 +607,34 @@ class MerkleTreeBenchmark:
         # Test with increasing sizes
         small_sizes = [100, 1_000, 10_000]
         large_sizes = [100_000]  # Can add 1_000_000 for full validation
-
-        results = {}
+        sizes = small_sizes + large_sizes
 
         # Run all benchmarks
-        results['construction'] = self.benchmark_tree_construction(small_sizes + large_sizes)
-        results['verification'] = self.benchmark_root_hash_verification(small_sizes + large_sizes)
-        results['proof_generation'] = self.benchmark_proof_generation(small_sizes + large_sizes)
-        results['proof_verification'] = self.benchmark_proof_verification(small_sizes)
-        results['memory'] = self.benchmark_memory_usage(small_sizes + large_sizes)
-        results['hashing'] = self.benchmark_hashing_speed()
-        results['tamper_detection'] = self.benchmark_tamper_detection(small_sizes)
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            results = {phase: {} for phase in SIZE_PHASES}
+            with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as executor:
+                runs = executor.map(_benchmark_size, sizes,
+                                    [size in small_sizes for size in sizes])
+                for output, size_results, validations in runs:
+                    print(output, end='')
+                    for phase, phase_results in size_results.items():
+                        results[phase].update(phase_results)
+                    self.validator.validations.extend(validations)
+            results['hashing'] = self.benchmark_hashing_speed()
+            results['review_hashing'] = self.benchmark_review_hashing()
+        else:
+            self._warmup()
+            results = {}
+            results['construction'] = self.benchmark_tree_construction(sizes)
+            results['verification'] = self.benchmark_root_hash_verification(sizes)
+            results['proof_generation'] = self.benchmark_proof_generation(sizes)
+            results['proof_verification'] = self.benchmark_proof_verification(small_sizes)
+            results['memory'] = self.benchmark_memory_usage(sizes)
+            results['hashing'] = self.benchmark_hashing_speed()
+            results['review_hashing'] = self.benchmark_review_hashing()
+            results['tamper_detection'] = self.benchmark_tamper_detection(small_sizes)
 
         # Generate validation report
         print("\n" + "=" * 60)
@@ -554,6 +763,7 @@ class MerkleTreeBenchmark:
                 report_lines.append(f"\nSize: {data['size']:,} records")
                 report_lines.append(f"  Total: {data['total_mb']:.2f} MB ({data['total_bytes']:,} bytes)")
                 report_lines.append(f"  Per leaf: {data['bytes_per_leaf']:.2f} bytes")
+                report_lines.append(f"  Peak during build: {data['peak_build_mb']:.2f} MB")
             report_lines.append("")
 
         # Hashing Speed Results
@@ -567,6 +777,17 @@ class MerkleTreeBenchmark:
             report_lines.append(f"  Throughput: {data['throughput_per_sec']:,.0f} hashes/sec")
             report_lines.append("")
 
+        # Review Hashing Results
+        if 'review_hashing' in results:
+            report_lines.append("-" * 70)
+            report_lines.append("REVIEW HASHING")
+            report_lines.append("-" * 70)
+            data = results['review_hashing']
+            report_lines.append(f"\nCount: {data['count']:,} reviews")
+            report_lines.append(f"  Time: {data['time_seconds']:.4f}s ({data['time_ms']:.2f}ms)")
+            report_lines.append(f"  Throughput: {data['throughput_per_sec']:,.0f} reviews/sec")
+            report_lines.append("")
+
         # Tamper Detection Results
         if 'tamper_detection' in results:
             report_lines.append("-" * 70)
@@ -611,10 +832,17 @@ class MerkleTreeBenchmark:
         }
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Run benchmark suite from command line."""
+    parser = argparse.ArgumentParser(description="Run the Merkle tree benchmark suite.")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="run the sizes in this many processes at once; faster, but the "
+             "timings then include contention between them (default: 1)")
+    args = parser.parse_args(argv)
+
     benchmark = MerkleTreeBenchmark()
-    results = benchmark.run_comprehensive_benchmark()
+    results = benchmark.run_comprehensive_benchmark(workers=args.workers)
 
     # Save results to files
     saved_files = benchmark.export_results(results)
@@ -15,9 +15,12 @@ Used to validate performance targets:
 - Hashing speed: >100K records/second
 """
 
+import math
 import time
 import sys
-from typing import Dict, Any, Callable, Optional, List
+import statistics
+import tracemalloc
+from typing import Dict, Any, Callable, Optional, List, NamedTuple
 from datetime import datetime
 from contextlib import contextmanager
 
@@ -26,20 +29,24 @@ class PerformanceTimer:
     """
     High-precision timer for performance measurement.
 
-    Uses time.perf_counter() for accurate timing.
+    Uses time.perf_counter_ns() for accurate timing; integer nanoseconds
+    avoid float rounding on sub-millisecond measurements.
     """
 
     def __init__(self):
         """Initialize performance timer."""
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        self.start_time: Optional[int] = None
+        self.end_time: Optional[int] = None
+        self.elapsed_ns: Optional[int] = None
         self.elapsed_ms: Optional[float] = None
 
     def start(self) -> None:
         """Start the timer."""
-        self.start_time = time.perf_counter()
         self.end_time = None
+        self.elapsed_ns = None
         self.elapsed_ms = None
+        # Read the clock last so the resets above are not timed
+        self.start_time = time.perf_counter_ns()
 
     def stop(self) -> float:
         """
@@ -51,10 +58,17 @@ class PerformanceTimer:
         if self.start_time is None:
             raise RuntimeError("Timer not started")
 
-        self.end_time = time.perf_counter()
-        self.elapsed_ms = (self.end_time - self.start_time) * 1000
+        self.end_time = time.perf_counter_ns()
+        self.elapsed_ns = self.end_time - self.start_time
+        self.elapsed_ms = self.elapsed_ns / 1_000_000
         return self.elapsed_ms
 
+    def get_elapsed_ns(self) -> int:
+        """Get elapsed time in nanoseconds."""
+        if self.elapsed_ns is None:
+            raise RuntimeError("Timer not stopped")
+        return self.elapsed_ns
+
     def get_elapsed_ms(self) -> float:
         """Get elapsed time in milliseconds."""
         if self.elapsed_ms is None:
@@ -94,7 +108,11 @@ class MemoryTracker:
     @staticmethod
     def get_object_size(obj: Any) -> int:
         """
-        Get size of an object in bytes.
+        Get the shallow size of an object in bytes.
+
+        Objects referenced by obj are not counted, so a list of dicts
+        reports only the list itself; use measure_peak() to measure what
+        an operation actually allocates.
 
         Args:
             obj: Object to measure
@@ -104,6 +122,39 @@ class MemoryTracker:
         """
         return sys.getsizeof(obj)
 
+    @staticmethod
+    @contextmanager
+    def measure_peak():
+        """
+        Context manager for the peak heap allocated by a block of code.
+
+        Uses tracemalloc; tracing is started for the block and stopped
+        again afterwards unless it was already running. Tracing slows
+        allocation down, so keep timed code out of the block.
+
+        Yields:
+            Dictionary whose 'peak_bytes' is filled in when the block exits
+
+        Example:
+            >>> with MemoryTracker.measure_peak() as memory:
+            ...     tree = MerkleTree(data)
+            >>> metrics.record_memory("construction", memory['peak_bytes'])
+        """
+        result = {'peak_bytes': 0}
+        was_tracing = tracemalloc.is_tracing()
+        if was_tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        try:
+            yield result
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            if not was_tracing:
+                tracemalloc.stop()
+            result['peak_bytes'] = peak - baseline
+
     @staticmethod
     def format_bytes(size_bytes: int) -> str:
         """
@@ -340,7 +391,7 @@ def measure_function(func: Callable, *args, **kwargs) -> Dict[str, Any]:
 
 
 def benchmark_iterations(func: Callable, iterations: int,
-                        *args, **kwargs) -> Dict[str, Any]:
+                        *args, warmup: int = 0, **kwargs) -> Dict[str, Any]:
     """
     Benchmark a function over multiple iterations.
 
@@ -348,6 +399,10 @@ def benchmark_iterations(func: Callable, iterations: int,
         func: Function to benchmark
         iterations: Number of iterations
         *args: Positional arguments for function
+        warmup: Untimed calls made before the timed iterations, so
+                one-time costs such as cache fills are not reported.
+                Keyword-only; func is called exactly iterations times
+                by default.
         **kwargs: Keyword arguments for function
 
     Returns:
@@ -355,26 +410,86 @@ def benchmark_iterations(func: Callable, iterations: int,
 
     Example:
         >>> stats = benchmark_iterations(my_function, 100, arg1, arg2)
-        >>> print(f"Average: {stats['avg_time_ms']:.2f}ms")
+        >>> print(f"Average: {stats['avg_time_ms']:.2f}ms, "
+        ...       f"p95: {stats['p95_time_ms']:.2f}ms")
     """
-    times: List[float] = []
+    perf_counter_ns = time.perf_counter_ns
+    elapsed_ns: List[int] = [0] * iterations
+
+    for _ in range(warmup):
+        func(*args, **kwargs)
 
-    for _ in range(iterations):
-        timer = PerformanceTimer()
-        with timer.measure():
-            func(*args, **kwargs)
-        times.append(timer.get_elapsed_ms())
+    for i in range(iterations):
+        start = perf_counter_ns()
+        func(*args, **kwargs)
+        elapsed_ns[i] = perf_counter_ns() - start
+
+    times = [ns / 1_000_000 for ns in elapsed_ns]
+    ordered = sorted(times)
+    total = sum(times)
 
     return {
         'iterations': iterations,
-        'total_time_ms': sum(times),
-        'avg_time_ms': sum(times) / iterations,
-        'min_time_ms': min(times),
-        'max_time_ms': max(times),
+        'total_time_ms': total,
+        'avg_time_ms': total / iterations,
+        'min_time_ms': ordered[0],
+        'max_time_ms': ordered[-1],
+        'median_time_ms': statistics.median(ordered),
+        # Nearest rank: the smallest time that 95% of samples do not exceed
+        'p95_time_ms': ordered[math.ceil(0.95 * iterations) - 1],
+        'stdev_time_ms': statistics.stdev(times) if iterations > 1 else 0.0,
         'times': times
     }
 
 
+def auto_iterations(func: Callable, target_ns: int = 100_000_000,
+                    max_iterations: int = 1_000_000) -> int:
+    """
+    Pick how many times to repeat a fast operation for a stable timing.
+
+    One call is timed and the count is scaled so the repeated loop runs
+    for at least target_ns; a single sub-millisecond sample is mostly
+    timer noise. Call func once beforehand if it has one-time costs.
+
+    Args:
+        func: Zero-argument callable to be timed
+        target_ns: Minimum total time to aim for, in nanoseconds
+        max_iterations: Upper bound on the count
+
+    Returns:
+        Number of iterations (at least 1)
+
+    Example:
+        >>> count = auto_iterations(proof.verify)
+        >>> timer = PerformanceTimer()
+        >>> with timer.measure():
+        ...     for _ in range(count):
+        ...         proof.verify()
+        >>> per_op_ns = timer.get_elapsed_ns() // count
+    """
+    start = time.perf_counter_ns()
+    func()
+    elapsed_ns = max(time.perf_counter_ns() - start, 1)
+    return max(1, min(max_iterations, -(-target_ns // elapsed_ns)))
+
+
+class Validation(NamedTuple):
+    """
+    Outcome of a single PerformanceValidator.validate() call.
+
+    A tuple rather than a dict so each validation is one small object;
+    _asdict() gives the dict form used in exported results.
+    """
+
+    name: str
+    actual: float
+    target: float
+    unit: str
+    passed: bool
+    less_is_better: bool
+    comparison: str
+
+
 class PerformanceValidator:
     """
     Validates performance against target thresholds.
@@ -384,7 +499,7 @@ class PerformanceValidator:
 
     def __init__(self):
         """Initialize performance validator."""
-        self.validations: List[Dict[str, Any]] = []
+        self.validations: List[Validation] = []
 
     def validate(self,
                 name: str,
@@ -417,15 +532,10 @@ class PerformanceValidator:
             passed = actual_value >= target_value
             comparison = f"{actual_value:.2f} >= {target_value:.2f}"
 
-        self.validations.append({
-            'name': name,
-            'actual': actual_value,
-            'target': target_value,
-            'unit': unit,
-            'passed': passed,
-            'less_is_better': less_is_better,
-            'comparison': comparison
-        })
+        self.validations.append(Validation(
+            name, actual_value, target_value, unit, passed,
+            less_is_better, comparison
+        ))
 
         return passed
 
@@ -437,14 +547,14 @@ class PerformanceValidator:
             Dictionary with all validation results
         """
         total = len(self.validations)
-        passed = sum(1 for v in self.validations if v['passed'])
+        passed = sum(v.passed for v in self.validations)
 
         return {
             'total_validations': total,
             'passed': passed,
             'failed': total - passed,
             'all_passed': passed == total,
-            'validations': self.validations
+            'validations': [v._asdict() for v in self.validations]
         }
 
     def generate_report(self) -> str:
@@ -454,22 +564,24 @@ class PerformanceValidator:
         Returns:
             Formatted report string
         """
-        results = self.get_results()
+        validations = self.validations
+        total = len(validations)
+        passed = sum(v.passed for v in validations)
 
         report = f"""
 Performance Validation Report
 {'=' * 60}
-Total Validations: {results['total_validations']}
-Passed: {results['passed']}
-Failed: {results['failed']}
-Status: {'✓ ALL PASSED' if results['all_passed'] else '✗ SOME FAILED'}
+Total Validations: {total}
+Passed: {passed}
+Failed: {total - passed}
+Status: {'✓ ALL PASSED' if passed == total else '✗ SOME FAILED'}
 
 Details:
 """
 
-        for v in results['validations']:
-            status = '✓' if v['passed'] else '✗'
-            report += f"  {status} {v['name']}: {v['comparison']} {v['unit']}\n"
+        for v in validations:
+            status = '✓' if v.passed else '✗'
+            report += f"  {status} {v.name}: {v.comparison} {v.unit}\n"
 
         report += f"{'=' * 60}\n"
         return report
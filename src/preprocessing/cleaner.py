@@ -10,8 +10,24 @@ Provides functions to:
 
 from typing import Dict, List, Optional, Any
 
+# Fields a review must have to be hashed, and all fields that are hashed
+_REQUIRED_FIELDS = ('reviewerID', 'asin')
+_REVIEW_FIELDS = ('reviewerID', 'asin', 'overall', 'unixReviewTime', 'reviewText')
 
-def normalize_review(review_dict: Dict[str, Any]) -> Dict[str, Any]:
+# str() of the star ratings, which nearly every record repeats. Only used
+# for floats: 1 == 1.0 == True as dict keys, and str() tells them apart.
+_OVERALL_STR = {rating: str(rating) for rating in (1.0, 2.0, 3.0, 4.0, 5.0)}
+
+
+def _overall_to_str(overall: Any) -> str:
+    """Return str(overall), looked up for the common float ratings."""
+    if type(overall) is float:
+        return _OVERALL_STR.get(overall) or str(overall)
+    return str(overall)
+
+
+def normalize_review(review_dict: Dict[str, Any],
+                     keep_original: bool = False) -> Dict[str, Any]:
     """
     Extract and normalize key fields from review dictionary.
 
@@ -20,6 +36,9 @@ def normalize_review(review_dict: Dict[str, Any]) -> Dict[str, Any]:
 
     Args:
         review_dict: Raw review dictionary from JSON
+        keep_original: Also store review_dict under '_original'. Off by
+                       default: the reference keeps every raw record
+                       alive as long as its normalized copy.
 
     Returns:
         Normalized review dictionary with standard fields
@@ -30,15 +49,17 @@ def normalize_review(review_dict: Dict[str, Any]) -> Dict[str, Any]:
         >>> normalized["overall"]
         '5.0'
     """
-    return {
+    normalized = {
         'reviewerID': str(review_dict.get('reviewerID', '')),
         'asin': str(review_dict.get('asin', '')),
-        'overall': str(review_dict.get('overall', '')),
+        'overall': _overall_to_str(review_dict.get('overall', '')),
         'unixReviewTime': str(review_dict.get('unixReviewTime', '')),
-        'reviewText': str(review_dict.get('reviewText', '')),
-        # Store original dict for reference if needed
-        '_original': review_dict
+        'reviewText': str(review_dict.get('reviewText', ''))
     }
+    if keep_original:
+        # Store original dict for reference if needed
+        normalized['_original'] = review_dict
+    return normalized
 
 
 def generate_canonical_string(review_dict: Dict[str, Any]) -> str:
@@ -86,21 +107,12 @@ def is_valid_review(review_dict: Dict[str, Any], require_all_fields: bool = Fals
         >>> is_valid_review(review, require_all_fields=True)
         False
     """
-    required_fields = ['reviewerID', 'asin']
-    all_fields = ['reviewerID', 'asin', 'overall', 'unixReviewTime', 'reviewText']
-
-    if require_all_fields:
-        # All fields must be present and non-empty
-        return all(
-            field in review_dict and str(review_dict[field]).strip()
-            for field in all_fields
-        )
-    else:
-        # At least reviewerID and asin must be present
-        return all(
-            field in review_dict and str(review_dict[field]).strip()
-            for field in required_fields
-        )
+    # All fields, or at least reviewerID and asin, must be present and
+    # non-empty. A plain loop: this runs once per record in batch cleaning
+    for field in _REVIEW_FIELDS if require_all_fields else _REQUIRED_FIELDS:
+        if field not in review_dict or not str(review_dict[field]).strip():
+            return False
+    return True
 
 
 def filter_incomplete_reviews(reviews: List[Dict[str, Any]],
@@ -154,7 +166,7 @@ def extract_review_fields(review_dict: Dict[str, Any]) -> Dict[str, str]:
     return {
         'reviewerID': str(review_dict.get('reviewerID', '')),
         'asin': str(review_dict.get('asin', '')),
-        'overall': str(review_dict.get('overall', '')),
+        'overall': _overall_to_str(review_dict.get('overall', '')),
         'unixReviewTime': str(review_dict.get('unixReviewTime', '')),
         'reviewText': str(review_dict.get('reviewText', ''))
     }
@@ -178,8 +190,11 @@ def sanitize_review_text(text: str, max_length: Optional[int] = None) -> str:
     # Remove null bytes
     text = text.replace('\x00', '')
 
-    # Normalize whitespace
-    text = ' '.join(text.split())
+    # Normalize whitespace. In printable ASCII the only whitespace is ' ',
+    # so text without doubled or edge spaces is already normalized.
+    if (not (text.isascii() and text.isprintable()) or '  ' in text
+            or text[:1] == ' ' or text[-1:] == ' '):
+        text = ' '.join(text.split())
 
     # Truncate if needed
     if max_length and len(text) > max_length:
@@ -190,7 +205,8 @@ def sanitize_review_text(text: str, max_length: Optional[int] = None) -> str:
 
 def batch_normalize_reviews(reviews: List[Dict[str, Any]],
                             filter_invalid: bool = True,
-                            sanitize_text: bool = True) -> List[Dict[str, Any]]:
+                            sanitize_text: bool = True,
+                            keep_original: bool = False) -> List[Dict[str, Any]]:
     """
     Normalize a batch of reviews efficiently.
 
@@ -198,6 +214,8 @@ def batch_normalize_reviews(reviews: List[Dict[str, Any]],
         reviews: List of review dictionaries
         filter_invalid: Remove invalid reviews
         sanitize_text: Clean review text
+        keep_original: Keep each raw dict under '_original' (see
+                       normalize_review())
 
     Returns:
         List of normalized reviews
@@ -209,22 +227,25 @@ def batch_normalize_reviews(reviews: List[Dict[str, Any]],
         True
     """
     normalized = []
+    # Local names for the per-record calls, looked up once per batch
+    append = normalized.append
+    is_valid = is_valid_review
+    normalize = normalize_review
+    sanitize = sanitize_review_text
 
     for review in reviews:
         # Skip invalid if requested
-        if filter_invalid and not is_valid_review(review):
+        if filter_invalid and not is_valid(review):
             continue
 
         # Normalize
-        norm_review = normalize_review(review)
+        norm_review = normalize(review, keep_original)
 
         # Sanitize text if requested
         if sanitize_text:
-            norm_review['reviewText'] = sanitize_review_text(
-                norm_review['reviewText']
-            )
+            norm_review['reviewText'] = sanitize(norm_review['reviewText'])
 
-        normalized.append(norm_review)
+        append(norm_review)
 
     return normalized
 
@@ -256,10 +277,9 @@ def get_review_stats(reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
     valid = len([r for r in reviews if is_valid_review(r)])
 
     # Count field completeness
-    fields = ['reviewerID', 'asin', 'overall', 'unixReviewTime', 'reviewText']
     field_counts = {
         field: sum(1 for r in reviews if field in r and str(r[field]).strip())
-        for field in fields
+        for field in _REVIEW_FIELDS
     }
 
     field_completeness = {
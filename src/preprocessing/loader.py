@@ -8,15 +8,396 @@ Provides:
 - Progress tracking
 """
 
+import codecs
 import json
+import os
 import pickle
+import queue
+import re
+import struct
+import threading
 from pathlib import Path
-from typing import Iterator, List, Dict, Any, Optional
-from tqdm import tqdm
+from typing import Iterator, List, Dict, Any, Optional, Tuple, Union
+from collections import Counter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
 
 from .cleaner import batch_normalize_reviews
 
 
+# Read size used when scanning raw files in binary mode
+SCAN_CHUNK_SIZE = 1 << 20
+
+# Sidecar file caching per-file dataset stats, stored next to the raw files
+MANIFEST_NAME = ".manifest.json"
+
+# Leaf hash cache header: format version, then size and mtime_ns of the
+# source file and of the review cache the hashed records came from
+_LEAF_CACHE_HEADER = struct.Struct('<QQQQQ')
+# Bump whenever review normalization, the canonical review string or leaf
+# hashing changes, so leaf hashes cached by older code are not reused
+LEAF_CACHE_VERSION = 2
+LEAF_HASH_SIZE = 32
+
+# Whitespace allowed between JSON tokens (same set as the json module)
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def _is_json_array(f) -> bool:
+    """
+    Check whether a binary file handle holds a JSON array.
+
+    Skips a UTF-8 byte order mark and any amount of leading whitespace,
+    looks at the first meaningful byte and rewinds the handle.
+
+    Args:
+        f: File object opened in binary mode
+
+    Returns:
+        True if the file starts with '[', False for line-delimited JSON
+    """
+    block = f.read(4096)
+    if block.startswith(codecs.BOM_UTF8):
+        block = block[len(codecs.BOM_UTF8):]
+    first = b''
+    while block:
+        first = block.lstrip(b' \t\n\r')[:1]
+        if first:
+            break
+        block = f.read(4096)
+    f.seek(0)
+    return first == b'['
+
+
+def _iter_json_array(f) -> Iterator[Any]:
+    """
+    Stream the elements of a JSON array from a binary file handle.
+
+    The file is read in SCAN_CHUNK_SIZE pieces and each element is
+    decoded with JSONDecoder.raw_decode as soon as it is complete, so
+    memory use is bounded by the largest element rather than the file.
+
+    Args:
+        f: File object opened in binary mode, positioned at the array
+
+    Yields:
+        Each element of the array in order
+
+    Raises:
+        json.JSONDecodeError: If the file is not a well-formed array, or
+            has anything but whitespace after it
+    """
+    decoder = json.JSONDecoder()
+    # utf-8-sig drops a leading byte order mark, as _is_json_array() does
+    utf8 = codecs.getincrementaldecoder('utf-8-sig')()
+    buf = ''
+    pos = 0
+    # Next token: '[' to open, 'first' (a value or ']'), 'value' after a
+    # comma, ',' (a comma or ']') after a value, or 'end' (nothing but
+    # whitespace) after the closing ']'
+    expect = '['
+    eof = False
+
+    while True:
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+
+        if pos < len(buf):
+            char = buf[pos]
+            if expect == 'end':
+                raise json.JSONDecodeError("Extra data", buf, pos)
+            if expect == '[':
+                if char != '[':
+                    raise json.JSONDecodeError("Expected '['", buf, pos)
+                expect = 'first'
+                pos += 1
+                continue
+            if expect == ',':
+                if char == ']':
+                    expect = 'end'
+                    pos += 1
+                    continue
+                if char != ',':
+                    raise json.JSONDecodeError("Expected ',' or ']'", buf, pos)
+                expect = 'value'
+                pos += 1
+                continue
+            if char == ']' and expect == 'first':
+                expect = 'end'
+                pos += 1
+                continue
+            if char in ',]':
+                raise json.JSONDecodeError("Expecting value", buf, pos)
+
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Element may be cut off at the chunk boundary
+                if eof:
+                    raise
+            else:
+                # A value cut at the chunk boundary may decode early (a
+                # number such as "1." of "1.5"), so wait until the comma
+                # or ']' after it has been read
+                after = _JSON_WHITESPACE.match(buf, end).end()
+                if (after < len(buf) and buf[after] in ',]') or eof:
+                    yield item
+                    pos = end
+                    expect = ','
+                    continue
+
+        if eof:
+            if expect not in ('[', 'end'):
+                raise json.JSONDecodeError("Unterminated array", buf, pos)
+            return
+
+        chunk = f.read(SCAN_CHUNK_SIZE)
+        eof = not chunk
+        buf = buf[pos:] + utf8.decode(chunk, final=eof)
+        pos = 0
+
+
+def _sample_lines(buf, limit: int) -> List[Dict[str, Any]]:
+    """
+    Parse the first records of a line-delimited JSON buffer.
+
+    Lines are located with find(b'\\n') and passed to the parser as raw
+    bytes slices, so no per-line decode or strip copy is made.
+
+    Args:
+        buf: bytes-like buffer of complete lines
+        limit: Maximum number of records to parse
+
+    Returns:
+        List of parsed records (malformed lines are skipped)
+    """
+    samples = []
+    start = 0
+    size = len(buf)
+
+    while start < size and len(samples) < limit:
+        end = buf.find(b'\n', start)
+        if end == -1:
+            end = size
+        line = buf[start:end]
+        start = end + 1
+
+        # Empty and lone '\r' lines are skipped without a copy; longer
+        # whitespace-only lines are rejected by the parser below
+        if len(line) <= 1:
+            continue
+        try:
+            samples.append(_json_loads(line))
+        except json.JSONDecodeError:
+            pass
+
+    return samples
+
+
+def count_reviews_in_file(filepath: str) -> int:
+    """
+    Count reviews in a JSON file without parsing every record.
+
+    Line-delimited files are read in 1MB binary chunks and newlines are
+    counted with bytes.count(), which scans in C instead of iterating
+    line-by-line in Python. JSON arrays are streamed element by element
+    rather than loaded whole.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        Number of records in the file
+
+    Example:
+        >>> count_reviews_in_file("data/raw/Electronics_5.json")
+        1689188
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    with open(filepath, 'rb') as f:
+        if _is_json_array(f):
+            return sum(1 for _ in _iter_json_array(f))
+
+        count = 0
+        last_byte = b'\n'
+        while True:
+            chunk = f.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+            count += chunk.count(b'\n')
+            last_byte = chunk[-1:]
+
+        # Last record may not be newline-terminated
+        if last_byte != b'\n':
+            count += 1
+
+    return count
+
+
+def scan_dataset(filepath: str, sample_size: int = 10) -> Dict[str, Any]:
+    """
+    Count, sample and summarize a JSON file in a single sequential read.
+
+    Line-delimited files are read in 1MB binary chunks. Every chunk is
+    newline-counted, and the first chunks are also split into records
+    (carrying partial lines across chunk boundaries) until sample_size
+    records have been parsed. Fields and ratings are aggregated from
+    the sampled records.
+
+    Args:
+        filepath: Path to JSON file
+        sample_size: Number of leading records to parse
+
+    Returns:
+        Dictionary with count, samples, fields and rating_distribution
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+
+    Example:
+        >>> stats = scan_dataset("data/raw/Electronics_5.json")
+        >>> stats["count"]
+        1689188
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    samples: List[Dict[str, Any]] = []
+    count = 0
+
+    with open(filepath, 'rb') as f:
+        if _is_json_array(f):
+            for review in _iter_json_array(f):
+                if count < sample_size:
+                    samples.append(review)
+                count += 1
+        else:
+            pending = b''
+            last_byte = b'\n'
+            while True:
+                chunk = f.read(SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                count += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+
+                if len(samples) < sample_size:
+                    pending += chunk
+                    cut = pending.rfind(b'\n') + 1
+                    if cut:
+                        samples.extend(_sample_lines(pending[:cut], sample_size - len(samples)))
+                        pending = pending[cut:]
+
+            # Last record may not be newline-terminated
+            if last_byte != b'\n':
+                count += 1
+                if len(samples) < sample_size:
+                    samples.extend(_sample_lines(pending, sample_size - len(samples)))
+
+    fields = set().union(*(review.keys() for review in samples))
+    ratings = Counter(str(review['overall']) for review in samples if 'overall' in review)
+
+    return {
+        "count": count,
+        "samples": samples,
+        "fields": sorted(fields),
+        "rating_distribution": dict(ratings)
+    }
+
+
+def load_manifest(directory: str) -> Dict[str, Any]:
+    """
+    Load the dataset manifest for a directory of raw files.
+
+    The manifest maps file names to previously computed stats together
+    with the file size and mtime they were computed for.
+
+    Args:
+        directory: Directory containing raw JSON files
+
+    Returns:
+        Manifest dictionary (empty if missing or unreadable)
+    """
+    manifest_path = Path(directory) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(directory: str, manifest: Dict[str, Any]) -> bool:
+    """
+    Save the dataset manifest for a directory of raw files.
+
+    Args:
+        directory: Directory containing raw JSON files
+        manifest: Manifest dictionary to save
+
+    Returns:
+        True if successful, False otherwise
+    """
+    manifest_path = Path(directory) / MANIFEST_NAME
+    try:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return True
+    except OSError as e:
+        print(f"Warning: Failed to save manifest: {e}")
+        return False
+
+
+def _fresh_stats(manifest: Dict[str, Any], filepath: Path) -> Optional[Dict[str, Any]]:
+    """
+    Get cached stats for a file if it is unchanged since they were stored.
+
+    Args:
+        manifest: Manifest dictionary for the file's directory
+        filepath: Path to raw JSON file
+
+    Returns:
+        Cached stats dictionary, or None on a miss or stale entry
+    """
+    entry = manifest.get(filepath.name)
+    if entry is None:
+        return None
+
+    stat = filepath.stat()
+    if entry.get('size') != stat.st_size or entry.get('mtime_ns') != stat.st_mtime_ns:
+        return None
+
+    return entry.get('stats')
+
+
+def _manifest_entry(filepath: Path, stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a manifest entry recording stats for a file's current version.
+
+    Args:
+        filepath: Path to raw JSON file
+        stats: Derived stats to cache
+
+    Returns:
+        Manifest entry with size, mtime_ns and stats
+    """
+    stat = filepath.stat()
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'stats': stats
+    }
+
+
 def load_json_reviews(filepath: str,
                      limit: Optional[int] = None,
                      normalize: bool = True,
@@ -63,15 +444,19 @@ def load_json_reviews(filepath: str,
         else:
             # Line-delimited JSON format (one JSON object per line)
             if show_progress:
+                # Imported here: tqdm is slow to import and only needed for progress bars
+                from tqdm import tqdm
+
                 # Estimate line count for progress bar
-                total_lines = sum(1 for _ in f) if file_size < 100_000_000 else None
-                f.seek(0)
+                total_lines = count_reviews_in_file(filepath) if file_size < 100_000_000 else None
                 progress = tqdm(total=total_lines or limit, desc=f"Loading {filepath.name}")
             else:
                 progress = None
 
-            for i, line in enumerate(f):
-                if limit and i >= limit:
+            # limit counts parsed records, as in batch_loader(), so both
+            # loaders fill the same review cache with the same records
+            for line in f:
+                if limit and len(reviews) >= limit:
                     break
 
                 line = line.strip()
@@ -178,6 +563,79 @@ def batch_loader(filepath: str,
         yield batch
 
 
+def prefetch_batches(filepath: str,
+                     batch_size: int = 10000,
+                     limit: Optional[int] = None,
+                     normalize: bool = True,
+                     max_pending: int = 4) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Load review batches on a background thread while the caller works.
+
+    Wraps batch_loader() so that reading and parsing the next batches
+    overlaps with whatever the caller does with the current one (e.g.
+    hashing leaves). At most max_pending batches are buffered.
+
+    Args:
+        filepath: Path to JSON file
+        batch_size: Number of reviews per batch
+        limit: Maximum total reviews to load
+        normalize: Whether to normalize reviews
+        max_pending: Maximum batches loaded ahead of the caller
+
+    Yields:
+        Batches of review dictionaries, in file order
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+
+    Example:
+        >>> leaves = []
+        >>> for batch in prefetch_batches("data/reviews.json"):
+        ...     leaves.extend(MerkleTree.hash_leaves(batch))
+    """
+    if not Path(filepath).exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    pending: queue.Queue = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    done = object()
+
+    def offer(item: Any) -> None:
+        # Give up if the consumer has stopped reading
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            for batch in batch_loader(filepath, batch_size, limit, normalize):
+                offer(batch)
+                if stop.is_set():
+                    return
+        except Exception as e:
+            offer(e)
+        finally:
+            offer(done)
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = pending.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
 def load_cached_reviews(cache_path: str) -> Optional[List[Dict[str, Any]]]:
     """
     Load reviews from preprocessed cache file.
@@ -242,6 +700,153 @@ def save_to_cache(reviews: List[Dict[str, Any]],
         return False
 
 
+def get_review_cache_path(json_path: str,
+                          cache_dir: str = "data/cache",
+                          limit: Optional[int] = None) -> Path:
+    """
+    Get the review cache path used by load_with_cache().
+
+    Args:
+        json_path: Path to original JSON file
+        cache_dir: Directory for cache files
+        limit: Maximum reviews loaded
+
+    Returns:
+        Path to the .pkl cache file
+    """
+    return Path(cache_dir) / f"{Path(json_path).stem}_{limit or 'all'}.pkl"
+
+
+def get_leaf_cache_path(json_path: str,
+                        cache_dir: str = "data/cache",
+                        limit: Optional[int] = None) -> Path:
+    """
+    Get the leaf hash cache path matching a load_with_cache() call.
+
+    Args:
+        json_path: Path to original JSON file
+        cache_dir: Directory for cache files
+        limit: Maximum reviews loaded
+
+    Returns:
+        Path to the .leaves cache file
+    """
+    return Path(cache_dir) / f"{Path(json_path).stem}_{limit or 'all'}.leaves"
+
+
+def _file_identity(path: Optional[str]) -> Tuple[int, int]:
+    """
+    Get the (size, mtime_ns) pair a leaf cache is tied to.
+
+    Args:
+        path: File path, or None for no file
+
+    Returns:
+        Size and mtime in nanoseconds, or (0, 0) for None
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    if path is None:
+        return 0, 0
+    stat = Path(path).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def load_leaf_hashes(cache_path: str, source_path: str,
+                     records_path: Optional[str] = None) -> Optional[List[bytes]]:
+    """
+    Load cached leaf hashes for a raw dataset file.
+
+    The cache is only used if it was written with the current
+    LEAF_CACHE_VERSION and the source file - and the review cache given
+    as records_path - have the same size and mtime as when the hashes
+    were saved.
+
+    Args:
+        cache_path: Path to cache file (.leaves)
+        source_path: Path to the raw JSON file the hashes came from
+        records_path: Path to the review cache (.pkl) holding the hashed
+                      records, if the hashes were saved against one
+
+    Returns:
+        List of 32-byte leaf hashes if the cache is valid, None otherwise
+    """
+    cache_path = Path(cache_path)
+    source_path = Path(source_path)
+
+    if not cache_path.exists() or not source_path.exists():
+        return None
+    if records_path is not None and not Path(records_path).exists():
+        return None
+
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        print(f"Warning: Failed to load leaf cache: {e}")
+        return None
+
+    header_size = _LEAF_CACHE_HEADER.size
+    if len(data) < header_size or (len(data) - header_size) % LEAF_HASH_SIZE:
+        return None
+
+    expected = (LEAF_CACHE_VERSION, *_file_identity(source_path), *_file_identity(records_path))
+    if _LEAF_CACHE_HEADER.unpack_from(data) != expected:
+        return None
+
+    return [data[i:i + LEAF_HASH_SIZE] for i in range(header_size, len(data), LEAF_HASH_SIZE)]
+
+
+def save_leaf_hashes(leaf_hashes: Union[List[bytes], bytes],
+                     cache_path: str,
+                     source_path: str,
+                     create_dirs: bool = True,
+                     records_path: Optional[str] = None) -> bool:
+    """
+    Save leaf hashes for a raw dataset file as one contiguous binary file.
+
+    Layout: 40-byte header (format version, then size and mtime_ns of the
+    source file and of the review cache) followed by the 32-byte hashes
+    back to back - ~32MB for 1M records. Save the review cache first so
+    the hashes are tied to the file as written.
+
+    Args:
+        leaf_hashes: List of 32-byte leaf hashes, or the same hashes
+                     already packed (e.g. MerkleTree.get_packed_leaf_hashes())
+        cache_path: Path for cache file (.leaves)
+        source_path: Path to the raw JSON file the hashes came from
+        create_dirs: Create parent directories if they don't exist
+        records_path: Path to the review cache (.pkl) holding the hashed
+                      records; load_leaf_hashes() must then be given it too
+
+    Returns:
+        True if successful, False otherwise
+
+    Example:
+        >>> tree = MerkleTree(reviews)
+        >>> save_leaf_hashes(tree.get_packed_leaf_hashes(),
+        ...                  "data/cache/reviews_all.leaves", "data/reviews.json",
+        ...                  records_path="data/cache/reviews_all.pkl")
+        True
+    """
+    cache_path = Path(cache_path)
+
+    if create_dirs:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        header = _LEAF_CACHE_HEADER.pack(LEAF_CACHE_VERSION, *_file_identity(source_path),
+                                         *_file_identity(records_path))
+        with open(cache_path, 'wb') as f:
+            f.write(header)
+            f.write(leaf_hashes if isinstance(leaf_hashes, bytes) else b''.join(leaf_hashes))
+        return True
+    except OSError as e:
+        print(f"Warning: Failed to save leaf cache: {e}")
+        return False
+
+
 def load_with_cache(json_path: str,
                    cache_dir: str = "data/cache",
                    limit: Optional[int] = None,
@@ -270,12 +875,10 @@ def load_with_cache(json_path: str,
         >>> reviews = load_with_cache("data/reviews.json")
     """
     json_path = Path(json_path)
-    cache_dir = Path(cache_dir)
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
 
-    # Generate cache filename
-    cache_name = f"{json_path.stem}_{limit or 'all'}.pkl"
-    cache_path = cache_dir / cache_name
+    cache_path = get_review_cache_path(json_path, cache_dir, limit)
+    cache_name = cache_path.name
 
     # Try to load from cache
     if not force_reload:
@@ -308,12 +911,16 @@ def load_with_cache(json_path: str,
     return reviews
 
 
-def get_dataset_info(filepath: str) -> Dict[str, Any]:
+def get_dataset_info(filepath: str, use_manifest: bool = True) -> Dict[str, Any]:
     """
     Get information about a dataset without loading it all.
 
+    Results are cached in a .manifest.json sidecar next to the file and
+    reused until the file's size or mtime changes.
+
     Args:
         filepath: Path to JSON file
+        use_manifest: Read and update the directory manifest
 
     Returns:
         Dictionary with dataset information
@@ -328,39 +935,118 @@ def get_dataset_info(filepath: str) -> Dict[str, Any]:
     if not filepath.exists():
         return {"error": "File not found"}
 
-    file_size = filepath.stat().st_size
+    stats = None
+    if use_manifest:
+        manifest = load_manifest(filepath.parent)
+        stats = _fresh_stats(manifest, filepath)
 
-    # Sample first few reviews
-    sample_reviews = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        first_char = f.read(1)
-        f.seek(0)
+    if stats is None:
+        stats = _compute_dataset_stats(str(filepath))
+        if use_manifest:
+            manifest[filepath.name] = _manifest_entry(filepath, stats)
+            save_manifest(filepath.parent, manifest)
 
-        if first_char == '[':
-            data = json.load(f)
-            sample_reviews = data[:10]
-            count = len(data)
+    return _format_dataset_info(filepath, stats)
+
+
+def get_datasets_info(directory: str,
+                      pattern: str = "*.json",
+                      max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get information about every dataset file in a directory.
+
+    Files without a fresh manifest entry are scanned in parallel, one
+    file per worker process, so wall-clock time is bounded by the
+    largest file rather than the sum of all files. The manifest is
+    read and written once, by the calling process.
+
+    Args:
+        directory: Directory containing raw JSON files
+        pattern: Glob pattern selecting dataset files
+        max_workers: Maximum worker processes (default: CPU count)
+
+    Returns:
+        Dictionary mapping file names to dataset information
+
+    Example:
+        >>> infos = get_datasets_info("data/raw")
+        >>> infos["Electronics_5.json"]["estimated_count"]
+        1689188
+    """
+    directory = Path(directory)
+    files = sorted(directory.glob(pattern))
+    if not files:
+        return {}
+
+    manifest = load_manifest(directory)
+    all_stats = {}
+    stale = []
+    for path in files:
+        stats = _fresh_stats(manifest, path)
+        if stats is None:
+            stale.append(path)
         else:
-            # Line-delimited: count lines
-            for i, line in enumerate(f):
-                if i < 10:
-                    try:
-                        sample_reviews.append(json.loads(line.strip()))
-                    except json.JSONDecodeError:
-                        pass
-                if i >= 100000:  # Don't count too many for very large files
-                    break
-            count = i + 1 if i < 100000 else None
+            all_stats[path.name] = stats
+
+    if stale:
+        workers = min(len(stale), max_workers or os.cpu_count() or 1)
+        paths = [str(path) for path in stale]
+
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                computed = list(executor.map(_compute_dataset_stats, paths))
+        else:
+            computed = [_compute_dataset_stats(path) for path in paths]
 
-    # Get field info from samples
-    fields = set()
-    for review in sample_reviews:
-        fields.update(review.keys())
+        for path, stats in zip(stale, computed):
+            manifest[path.name] = _manifest_entry(path, stats)
+            all_stats[path.name] = stats
+        save_manifest(directory, manifest)
 
+    return {
+        path.name: _format_dataset_info(path, all_stats[path.name])
+        for path in files
+    }
+
+
+def _compute_dataset_stats(filepath: str) -> Dict[str, Any]:
+    """
+    Scan a dataset file and derive its cacheable stats.
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        Dictionary with count, sample size, fields and ratings
+    """
+    # Count and sample in one pass over the file
+    scan = scan_dataset(filepath)
+
+    return {
+        "estimated_count": scan["count"],
+        "sample_count": len(scan["samples"]),
+        "fields": scan["fields"],
+        "rating_distribution": scan["rating_distribution"]
+    }
+
+
+def _format_dataset_info(filepath: Path, stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine cached stats with the file's current path and size.
+
+    Args:
+        filepath: Path to JSON file
+        stats: Stats from _compute_dataset_stats or the manifest
+
+    Returns:
+        Dataset information dictionary
+    """
     return {
         "filepath": str(filepath),
-        "file_size_mb": file_size / (1024 * 1024),
-        "estimated_count": count,
-        "sample_count": len(sample_reviews),
-        "fields": sorted(list(fields))
+        "file_size_mb": filepath.stat().st_size / (1024 * 1024),
+        **stats
     }
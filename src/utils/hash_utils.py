@@ -12,6 +12,7 @@ Design principles:
 """
 
 import hashlib
+from typing import List, Tuple
 
 
 def hash_data(data: str) -> bytes:
@@ -31,6 +32,27 @@ def hash_data(data: str) -> bytes:
     return hashlib.sha256(data.encode('utf-8')).digest()
 
 
+def hash_many(items: List[str]) -> List[bytes]:
+    """
+    Hash many strings in one pass.
+
+    Equivalent to [hash_data(item) for item in items] without a Python
+    call per item, which is a large share of hashing a short string.
+
+    Args:
+        items: Strings to hash
+
+    Returns:
+        List of 32-byte SHA-256 digests, one per item
+
+    Example:
+        >>> hash_many(["a", "b"])
+        [b'...', b'...'] # hash_data("a"), hash_data("b")
+    """
+    sha256 = hashlib.sha256
+    return [sha256(item.encode('utf-8')).digest() for item in items]
+
+
 def hash_pair(left: bytes, right: bytes) -> bytes:
     """
     Hash the concatenation of two hash values.
@@ -54,6 +76,81 @@ def hash_pair(left: bytes, right: bytes) -> bytes:
     return hashlib.sha256(left + right).digest()
 
 
+def hash_pairs(level: List[bytes]) -> List[bytes]:
+    """
+    Hash adjacent pairs of a level into the level above.
+
+    Equivalent to calling hash_pair() on (level[0], level[1]),
+    (level[2], level[3]), ... but without a Python call per pair, which
+    dominates the cost of hashing a 64-byte input.
+
+    Args:
+        level: List of 32-byte hashes; an odd last hash is left out
+
+    Returns:
+        List of len(level) // 2 parent hashes
+
+    Example:
+        >>> hash_pairs([hash_data("a"), hash_data("b")])
+        [b'...'] # hash_pair(hash_data("a"), hash_data("b"))
+    """
+    sha256 = hashlib.sha256
+    nodes = iter(level)
+    return [sha256(left + right).digest() for left, right in zip(nodes, nodes)]
+
+
+def fold_path(leaf_hash: bytes, proof_path: List[Tuple[bytes, bool]]) -> bytes:
+    """
+    Fold a leaf hash up a proof path to the root it implies.
+
+    Equivalent to calling hash_pair() once per step, with the sibling on
+    the left when its flag is set, but without a Python call per step.
+
+    Args:
+        leaf_hash: 32-byte hash of the leaf
+        proof_path: List of (sibling_hash, is_left) tuples, leaf to root
+
+    Returns:
+        32-byte hash reached at the top of the path
+
+    Example:
+        >>> left, right = hash_data("a"), hash_data("b")
+        >>> fold_path(right, [(left, True)]) == hash_pair(left, right)
+        True
+    """
+    sha256 = hashlib.sha256
+    current = leaf_hash
+    for sibling, is_left in proof_path:
+        if is_left:
+            current = sha256(sibling + current).digest()
+        else:
+            current = sha256(current + sibling).digest()
+    return current
+
+
+def hash_records(buffer: bytes, record_size: int) -> List[bytes]:
+    """
+    Hash consecutive fixed-size records packed in one buffer.
+
+    Lets raw SHA-256 throughput be measured without building a Python
+    object per record first.
+
+    Args:
+        buffer: Packed records; a trailing partial record is hashed as is
+        record_size: Size of each record in bytes
+
+    Returns:
+        List of 32-byte digests, one per record
+
+    Example:
+        >>> hash_records(b"ab" * 64, 64)
+        [b'...', b'...'] # hash of each 64-byte record
+    """
+    sha256 = hashlib.sha256
+    return [sha256(buffer[i:i + record_size]).digest()
+            for i in range(0, len(buffer), record_size)]
+
+
 def hash_review(review_dict: dict) -> bytes:
     """
     Hash a review using canonical string representation.
@@ -73,7 +170,8 @@ def hash_review(review_dict: dict) -> bytes:
         b'...' # 32 bytes
     """
     canonical = generate_canonical_string(review_dict)
-    return hash_data(canonical)
+    # Same as hash_data(canonical), inlined: this runs once per leaf
+    return hashlib.sha256(canonical.encode('utf-8')).digest()
 
 
 def generate_canonical_string(review_dict: dict) -> str:
@@ -137,3 +235,34 @@ def hex_to_bytes(hex_str: str) -> bytes:
         b'...' # 32 bytes
     """
     return bytes.fromhex(hex_str)
+
+
+def has_sha_extensions(cpuinfo_path: str = "/proc/cpuinfo") -> bool:
+    """
+    Check whether the CPU advertises SHA-256 instructions.
+
+    hashlib.sha256 is backed by OpenSSL, which already uses SHA-NI (x86)
+    or the ARMv8 SHA2 extensions when present; this only reports whether
+    that fast path is available.
+
+    Args:
+        cpuinfo_path: Path to the Linux cpuinfo file
+
+    Returns:
+        True if 'sha_ni' or 'sha2' is listed in the CPU flags,
+        False otherwise or if cpuinfo is unavailable
+
+    Example:
+        >>> has_sha_extensions()
+        True
+    """
+    try:
+        with open(cpuinfo_path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() in ('flags', 'Features'):
+                    flags = value.split()
+                    return 'sha_ni' in flags or 'sha2' in flags
+    except OSError:
+        pass
+    return False
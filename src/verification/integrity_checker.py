@@ -18,11 +18,9 @@ Performance:
 
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-from pathlib import Path
 
 from merkle.tree import MerkleTree
 from utils.storage import HashStorage
-from utils.hash_utils import bytes_to_hex, hex_to_bytes
 
 
 class IntegrityChecker:
@@ -50,7 +50,10 @@ class TamperDetector:
         Detect tampering by comparing baseline and current trees.
 
         Analyzes leaf hashes to identify all changes between the trees.
-        Time complexity: O(n) where n = max(baseline_size, current_size)
+        Time complexity: O(n) where n = max(baseline_size, current_size),
+        but the leaf comparison is a block-wise memcmp (see
+        MerkleTree.diff_leaves()), so a handful of edits costs only
+        O(sqrt(n)) Python steps
 
         Args:
             baseline_tree: The trusted baseline tree
@@ -73,31 +76,15 @@ class TamperDetector:
             ...     print(f"Deleted: {len(report['deletions'])}")
             ...     print(f"Inserted: {len(report['insertions'])}")
         """
-        baseline_leaves = baseline_tree.get_all_leaf_hashes()
-        current_leaves = current_tree.get_all_leaf_hashes()
+        baseline_size = baseline_tree.get_leaf_count()
+        current_size = current_tree.get_leaf_count()
 
-        baseline_size = len(baseline_leaves)
-        current_size = len(current_leaves)
-
-        # Detect changes
-        modifications = []
+        # Detect changes; modifications are checked in the overlapping range
+        modifications = baseline_tree.diff_leaves(current_tree)
         deletions = []
         insertions = []
 
-        if baseline_size == current_size:
-            # Same size - direct comparison
-            for i in range(baseline_size):
-                if baseline_leaves[i] != current_leaves[i]:
-                    modifications.append(i)
-        else:
-            # Different sizes - more complex analysis
-            min_size = min(baseline_size, current_size)
-
-            # Check modifications in overlapping range
-            for i in range(min_size):
-                if baseline_leaves[i] != current_leaves[i]:
-                    modifications.append(i)
-
+        if baseline_size != current_size:
             # Identify deletions/insertions
             if baseline_size > current_size:
                 # Records were deleted
@@ -134,22 +121,22 @@ class TamperDetector:
                 'modifications': [
                     {
                         'index': idx,
-                        'baseline_hash': bytes_to_hex(baseline_leaves[idx]),
-                        'current_hash': bytes_to_hex(current_leaves[idx])
+                        'baseline_hash': bytes_to_hex(baseline_tree.get_leaf_hash(idx)),
+                        'current_hash': bytes_to_hex(current_tree.get_leaf_hash(idx))
                     }
                     for idx in modifications[:10]  # Limit to first 10
                 ],
                 'deletions': [
                     {
                         'index': idx,
-                        'baseline_hash': bytes_to_hex(baseline_leaves[idx])
+                        'baseline_hash': bytes_to_hex(baseline_tree.get_leaf_hash(idx))
                     }
                     for idx in deletions[:10]
                 ],
                 'insertions': [
                     {
                         'index': idx,
-                        'current_hash': bytes_to_hex(current_leaves[idx])
+                        'current_hash': bytes_to_hex(current_tree.get_leaf_hash(idx))
                     }
                     for idx in insertions[:10]
                 ]
@@ -229,17 +216,10 @@ class TamperDetector:
             >>> unchanged = detector.find_unchanged_records(baseline, current)
             >>> print(f"{len(unchanged)} records are still valid")
         """
-        baseline_leaves = baseline_tree.get_all_leaf_hashes()
-        current_leaves = current_tree.get_all_leaf_hashes()
-
-        unchanged = []
-        min_size = min(len(baseline_leaves), len(current_leaves))
-
-        for i in range(min_size):
-            if baseline_leaves[i] == current_leaves[i]:
-                unchanged.append(i)
+        min_size = min(baseline_tree.get_leaf_count(), current_tree.get_leaf_count())
+        modified = set(baseline_tree.diff_leaves(current_tree))
 
-        return unchanged
+        return [i for i in range(min_size) if i not in modified]
 
     def get_tampering_statistics(self,
                                 baseline_tree: MerkleTree,
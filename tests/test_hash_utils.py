@@ -8,6 +8,7 @@ Tests cover:
 - Deterministic hashing
 """
 
+import hashlib
 import pytest
 import sys
 from pathlib import Path
@@ -17,11 +18,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from utils.hash_utils import (
     hash_data,
+    hash_many,
     hash_pair,
+    hash_pairs,
+    fold_path,
+    hash_records,
     hash_review,
     generate_canonical_string,
     bytes_to_hex,
-    hex_to_bytes
+    hex_to_bytes,
+    has_sha_extensions
 )
 
 
@@ -59,6 +65,19 @@ class TestHashData:
         assert len(result) == 32
 
 
+class TestHashMany:
+    """Test hash_many function."""
+
+    def test_hash_many_matches_hash_data(self):
+        """Test that each digest equals hash_data of the matching string."""
+        items = ["a", "b", "日本語", ""]
+        assert hash_many(items) == [hash_data(item) for item in items]
+
+    def test_hash_many_empty(self):
+        """Test that no strings produce no digests."""
+        assert hash_many([]) == []
+
+
 class TestHashPair:
     """Test hash_pair function."""
 
@@ -94,6 +113,56 @@ class TestHashPair:
         assert len(result) == 32
 
 
+class TestHashPairs:
+    """Test hash_pairs function."""
+
+    def test_hash_pairs_matches_hash_pair(self):
+        """Test that each output equals hash_pair of the matching inputs."""
+        level = [hash_data(f"node{i}") for i in range(8)]
+        result = hash_pairs(level)
+        assert result == [hash_pair(level[i], level[i + 1]) for i in range(0, 8, 2)]
+
+    def test_hash_pairs_odd_level(self):
+        """Test that an odd last hash gets no parent."""
+        level = [hash_data(f"node{i}") for i in range(3)]
+        assert hash_pairs(level) == [hash_pair(level[0], level[1])]
+
+    def test_hash_pairs_empty(self):
+        """Test that an empty level produces no parents."""
+        assert hash_pairs([]) == []
+
+
+class TestFoldPath:
+    """Test fold_path function."""
+
+    def test_fold_path_matches_hash_pair(self):
+        """Test that each step pairs the sibling on the side its flag gives."""
+        leaf, a, b = hash_data("leaf"), hash_data("a"), hash_data("b")
+        expected = hash_pair(hash_pair(a, leaf), b)
+        assert fold_path(leaf, [(a, True), (b, False)]) == expected
+
+    def test_fold_path_empty(self):
+        """Test that an empty path returns the leaf hash itself."""
+        leaf = hash_data("leaf")
+        assert fold_path(leaf, []) == leaf
+
+
+class TestHashRecords:
+    """Test hash_records function."""
+
+    def test_hash_records_hashes_each_record(self):
+        """Test that each fixed-size record is hashed separately."""
+        records = [bytes([i]) * 64 for i in range(3)]
+        result = hash_records(b''.join(records), 64)
+        assert result == [hashlib.sha256(r).digest() for r in records]
+
+    def test_hash_records_partial_tail(self):
+        """Test that a trailing partial record is still hashed."""
+        result = hash_records(b'a' * 10, 4)
+        assert result[-1] == hashlib.sha256(b'aa').digest()
+        assert len(result) == 3
+
+
 class TestGenerateCanonicalString:
     """Test generate_canonical_string function."""
 
@@ -213,6 +282,32 @@ class TestHexToBytes:
         assert original == recovered
 
 
+class TestHasShaExtensions:
+    """Test CPU SHA extension detection."""
+
+    def test_detects_x86_sha_ni(self, tmp_path):
+        """Test detection from x86 flags."""
+        cpuinfo = tmp_path / "cpuinfo"
+        cpuinfo.write_text("processor\t: 0\nflags\t\t: fpu sse2 sha_ni avx2\n")
+        assert has_sha_extensions(str(cpuinfo)) is True
+
+    def test_detects_arm_sha2(self, tmp_path):
+        """Test detection from ARM features."""
+        cpuinfo = tmp_path / "cpuinfo"
+        cpuinfo.write_text("processor\t: 0\nFeatures\t: fp asimd aes sha1 sha2\n")
+        assert has_sha_extensions(str(cpuinfo)) is True
+
+    def test_no_sha_flags(self, tmp_path):
+        """Test a CPU without SHA extensions."""
+        cpuinfo = tmp_path / "cpuinfo"
+        cpuinfo.write_text("processor\t: 0\nflags\t\t: fpu sse2\n")
+        assert has_sha_extensions(str(cpuinfo)) is False
+
+    def test_missing_cpuinfo(self, tmp_path):
+        """Test that a missing cpuinfo file reports False."""
+        assert has_sha_extensions(str(tmp_path / "missing")) is False
+
+
 class TestIntegration:
     """Integration tests for hash utilities."""
 
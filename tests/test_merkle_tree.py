@@ -206,6 +206,11 @@ class TestMerkleTreeLeafAccess:
         assert all(isinstance(h, bytes) for h in leaves)
         assert all(len(h) == 32 for h in leaves)
 
+    def test_packed_leaf_hashes(self):
+        """Test that packed leaf hashes match the per-leaf hashes."""
+        tree = MerkleTree(["a", "b", "c"])
+        assert tree.get_packed_leaf_hashes() == b''.join(tree.get_all_leaf_hashes())
+
     def test_leaf_hashes_are_copy(self):
         """Test that get_all_leaf_hashes returns a copy."""
         tree = MerkleTree(["a", "b"])
@@ -264,6 +269,12 @@ class TestMerkleTreeSerialization:
         assert isinstance(tree_dict['leaf_hashes'], list)
         assert tree_dict['leaf_count'] == 3
 
+    def test_to_dict_leaf_hashes_hex(self):
+        """Test that each leaf is listed as its own 64-character hex hash."""
+        tree = MerkleTree(["a", "b", "c"])
+
+        assert tree.to_dict()['leaf_hashes'] == [hash_data(x).hex() for x in ["a", "b", "c"]]
+
     def test_from_dict(self):
         """Test creating tree from dictionary."""
         original = MerkleTree(["a", "b", "c"])
@@ -294,6 +305,253 @@ class TestMerkleTreeSerialization:
             assert restored.get_leaf_hash(i) == original.get_leaf_hash(i)
 
 
+class TestMerkleTreeIncrementalUpdates:
+    """Test incremental leaf updates against full rebuilds."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 16, 33, 100])
+    def test_update_leaf_matches_rebuild(self, size):
+        """Test that updating a leaf gives the same root as a rebuild."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data)
+
+        index = size // 2
+        tree.update_leaf(index, "modified")
+        data[index] = "modified"
+
+        assert tree.get_root_hash() == MerkleTree(data).get_root_hash()
+        assert tree.get_leaf_hash(index) == hash_data("modified")
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 4, 15, 16, 63, 64])
+    def test_append_leaf_matches_rebuild(self, size):
+        """Test appending across block and power-of-two boundaries."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data)
+
+        tree.append_leaf("new")
+        data.append("new")
+
+        assert tree.get_leaf_count() == size + 1
+        assert tree.get_root_hash() == MerkleTree(data).get_root_hash()
+
+    @pytest.mark.parametrize("size,index", [(2, 0), (3, 2), (5, 1), (17, 0), (17, 16), (64, 40), (65, 3)])
+    def test_remove_leaf_matches_rebuild(self, size, index):
+        """Test removing leaves across block and power-of-two boundaries."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data)
+
+        tree.remove_leaf(index)
+        del data[index]
+
+        assert tree.get_leaf_count() == size - 1
+        assert tree.get_all_leaf_hashes() == MerkleTree(data).get_all_leaf_hashes()
+        assert tree.get_root_hash() == MerkleTree(data).get_root_hash()
+        assert tree.get_proof(0, data[0]).verify()
+
+    def test_remove_only_leaf_raises(self):
+        """Test that a tree cannot be emptied."""
+        tree = MerkleTree(["a"])
+        with pytest.raises(ValueError):
+            tree.remove_leaf(0)
+
+    def test_update_leaf_with_same_data_keeps_root(self):
+        """Test that rewriting a leaf with identical data skips rehashing."""
+        tree = MerkleTree([f"item_{i}" for i in range(20)])
+        root = tree.get_root_hash()
+
+        tree.update_leaf(7, "item_7")
+
+        assert tree.get_root_hash() is root
+
+    def test_update_leaf_out_of_range(self):
+        """Test that updating an invalid index raises IndexError."""
+        tree = MerkleTree(["a", "b"])
+        with pytest.raises(IndexError):
+            tree.update_leaf(2, "x")
+
+    def test_update_restored_tree(self):
+        """Test updating a tree restored from a dict."""
+        data = [f"item_{i}" for i in range(20)]
+        tree = MerkleTree.from_dict(MerkleTree(data).to_dict())
+
+        tree.update_leaf(5, "modified")
+        data[5] = "modified"
+
+        assert tree.get_root_hash() == MerkleTree(data).get_root_hash()
+
+    def test_with_leaf_replaced_leaves_original(self):
+        """Test that with_leaf_replaced returns a new tree."""
+        tree = MerkleTree(["a", "b", "c"])
+        original_root = tree.get_root_hash()
+
+        tampered = tree.with_leaf_replaced(1, "x")
+
+        assert tree.get_root_hash() == original_root
+        assert tampered.get_root_hash() == MerkleTree(["a", "x", "c"]).get_root_hash()
+
+    def test_with_leaf_appended_leaves_original(self):
+        """Test that with_leaf_appended returns a new tree."""
+        tree = MerkleTree(["a", "b", "c"])
+
+        grown = tree.with_leaf_appended("d")
+
+        assert tree.get_leaf_count() == 3
+        assert grown.get_root_hash() == MerkleTree(["a", "b", "c", "d"]).get_root_hash()
+
+
+class TestMerkleTreeDiffLeaves:
+    """Test leaf-level comparison between trees."""
+
+    def test_identical_trees(self):
+        """Test that identical trees have no differing leaves."""
+        data = [f"item_{i}" for i in range(50)]
+        assert MerkleTree(data).diff_leaves(MerkleTree(data)) == []
+
+    @pytest.mark.parametrize("size", [1, 2, 17, 100, 1000])
+    def test_finds_modified_leaves(self, size):
+        """Test that every modified position is reported, in order."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data)
+        modified = sorted({0, size // 3, size - 1})
+        for index in modified:
+            data[index] = f"tampered_{index}"
+
+        assert tree.diff_leaves(MerkleTree(data)) == modified
+
+    def test_compares_overlapping_range_only(self):
+        """Test that extra leaves in the longer tree are not reported."""
+        data = [f"item_{i}" for i in range(20)]
+        tree = MerkleTree(data)
+        longer = MerkleTree(data[:5] + ["x"] + data[6:] + ["extra"])
+
+        assert tree.diff_leaves(longer) == [5]
+        assert longer.diff_leaves(tree) == [5]
+
+
+class TestMerkleTreeBatchProofs:
+    """Test batch proof generation."""
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 17, 100])
+    def test_get_proofs_matches_get_proof(self, size):
+        """Test that batch proofs equal individually generated proofs."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data)
+        indices = list(range(size))
+
+        proofs = tree.get_proofs(indices, data)
+
+        for index, proof in zip(indices, proofs):
+            assert proof == tree.get_proof(index, data[index])
+            assert proof.verify()
+
+    def test_get_proofs_without_data(self):
+        """Test batch proofs without leaf data."""
+        tree = MerkleTree(["a", "b", "c"])
+        proofs = tree.get_proofs([2, 0])
+
+        assert [p.leaf_index for p in proofs] == [2, 0]
+        assert all(p.leaf_data is None for p in proofs)
+
+    def test_get_proofs_out_of_range(self):
+        """Test that an invalid index raises IndexError."""
+        tree = MerkleTree(["a", "b"])
+        with pytest.raises(IndexError):
+            tree.get_proofs([0, 5])
+
+    @pytest.mark.parametrize("size,start,end", [(1, 0, 1), (17, 0, 17), (17, 3, 9), (100, 7, 70), (5, 2, 2)])
+    def test_get_proofs_range_matches_get_proof(self, size, start, end):
+        """Test that range proofs equal individually generated proofs."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data)
+
+        proofs = tree.get_proofs_range(start, end, data[start:end])
+
+        assert [p.leaf_index for p in proofs] == list(range(start, end))
+        for index, proof in zip(range(start, end), proofs):
+            assert proof == tree.get_proof(index, data[index])
+            assert proof.verify()
+
+    def test_get_proofs_range_out_of_range(self):
+        """Test that a range past the last leaf raises IndexError."""
+        tree = MerkleTree(["a", "b"])
+        with pytest.raises(IndexError):
+            tree.get_proofs_range(0, 3)
+
+
+class TestMerkleTreeFromLeafHashes:
+    """Test building trees from precomputed leaf hashes."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 10, 64, 65])
+    def test_from_leaf_hashes_matches_constructor(self, size):
+        """Test that the root matches a tree built from the data."""
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree.from_leaf_hashes(MerkleTree.hash_leaves(data))
+
+        assert tree.get_root_hash() == MerkleTree(data).get_root_hash()
+        assert tree.get_leaf_count() == size
+
+    def test_from_leaf_hashes_with_dicts(self):
+        """Test that review dicts hash the same way as in the constructor."""
+        reviews = [{"reviewerID": "A1", "asin": "B1", "overall": 5.0,
+                    "unixReviewTime": 1, "reviewText": "Great"}]
+        leaves = MerkleTree.hash_leaves(reviews)
+
+        assert leaves == MerkleTree(reviews).get_all_leaf_hashes()
+
+    def test_from_leaf_hashes_copies_input(self):
+        """Test that later changes to the input list don't affect the tree."""
+        leaves = MerkleTree.hash_leaves(["a", "b"])
+        tree = MerkleTree.from_leaf_hashes(leaves)
+        leaves[0] = hash_data("x")
+
+        assert tree.get_leaf_hash(0) == hash_data("a")
+
+    def test_hash_leaves_mixed_types(self):
+        """Test that strings mixed with other items hash like each alone."""
+        data = ["a", {"reviewerID": "A1"}, 7, "b"]
+        leaves = MerkleTree.hash_leaves(data)
+
+        assert leaves == [MerkleTree.hash_leaves([item])[0] for item in data]
+        assert leaves[2] == hash_data("7")
+
+    def test_hash_leaves_with_workers(self, monkeypatch):
+        """Test that parallel leaf hashing preserves order and values."""
+        import merkle.tree
+        monkeypatch.setattr(merkle.tree, 'LEAF_CHUNK_SIZE', 4)
+
+        data = [f"item_{i}" for i in range(10)]
+        assert MerkleTree.hash_leaves(data, workers=2) == MerkleTree.hash_leaves(data)
+
+    def test_constructor_with_workers(self, monkeypatch):
+        """Test that building with worker processes gives the same tree."""
+        import merkle.tree
+        monkeypatch.setattr(merkle.tree, 'LEAF_CHUNK_SIZE', 4)
+
+        data = [f"item_{i}" for i in range(10)]
+        tree = MerkleTree(data, workers=2)
+
+        assert tree.get_root_hash() == MerkleTree(data).get_root_hash()
+        assert tree.get_all_leaf_hashes() == MerkleTree.hash_leaves(data)
+
+    @pytest.mark.parametrize("size", [3, 37, 100])
+    def test_constructor_with_workers_reduces_blocks(self, monkeypatch, size):
+        """Test that blocks reduced in workers match an in-process build."""
+        import merkle.tree
+        monkeypatch.setattr(merkle.tree, 'LEAF_CHUNK_SIZE', 2)
+
+        data = [f"item_{i}" for i in range(size)]
+        tree = MerkleTree(data, workers=2)
+        expected = MerkleTree(data)
+
+        assert tree.get_root_hash() == expected.get_root_hash()
+        assert tree._get_cached_layer() == expected._get_cached_layer()
+        assert tree.get_proof(size - 1, data[size - 1]).verify()
+
+    def test_from_empty_leaf_hashes_raises(self):
+        """Test that empty input raises ValueError."""
+        with pytest.raises(ValueError):
+            MerkleTree.from_leaf_hashes([])
+
+
 class TestMerkleTreeMemoryEfficiency:
     """Test memory efficiency of hybrid storage."""
 
@@ -330,6 +588,24 @@ class TestMerkleTreeMemoryEfficiency:
         # Each leaf hash is 32 bytes, so 1000 leaves ≈ 32KB + overhead
         assert stats['total_mb'] < 0.1  # Should be well under 100KB
 
+    def test_leaf_storage_is_exactly_32_bytes_per_leaf(self):
+        """Test that leaf hashes are packed without per-hash overhead."""
+        tree = MerkleTree([f"item{i}" for i in range(1000)])
+        tree.append_leaf("extra")
+        stats = tree.get_memory_usage()
+
+        assert stats['leaf_hashes_bytes'] == 32 * 1001
+        assert tree.get_leaf_hash(1000) == MerkleTree(["extra"]).get_leaf_hash(0)
+
+    def test_cached_layer_reported_separately(self):
+        """Test that the cached layer is reported but not in total_bytes."""
+        tree = MerkleTree([f"item{i}" for i in range(1000)])
+        stats = tree.get_memory_usage()
+
+        assert stats['cached_layer_bytes'] > 32 * len(tree._get_cached_layer())
+        assert stats['total_bytes'] == (stats['root_hash_bytes'] + stats['leaf_hashes_bytes']
+                                        + stats['list_overhead_bytes'])
+
 
 class TestMerkleTreeRootHashHex:
     """Test hex representation of root hash."""
@@ -352,6 +628,16 @@ class TestMerkleTreeRootHashHex:
 
         assert hex1 == hex2
 
+    def test_root_hash_hex_follows_updates(self):
+        """Test that the cached hex root is refreshed after an update."""
+        tree = MerkleTree(["a", "b", "c"])
+        before = tree.get_root_hash_hex()
+
+        tree.update_leaf(0, "x")
+
+        assert tree.get_root_hash_hex() != before
+        assert tree.get_root_hash_hex() == bytes_to_hex(tree.get_root_hash())
+
 
 class TestMerkleTreeEdgeCases:
     """Test edge cases and special scenarios."""
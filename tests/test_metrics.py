@@ -0,0 +1,221 @@
+"""
+Unit tests for performance metrics module.
+
+Tests cover:
+- Iteration benchmarking and its statistics
+- Automatic iteration counts
+- Peak memory tracing
+- Target validation results and report
+"""
+
+import pytest
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import performance.metrics as metrics
+from performance.metrics import (
+    MemoryTracker,
+    PerformanceValidator,
+    auto_iterations,
+    benchmark_iterations
+)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Replace the clock used by the metrics module with a counter.
+
+    Returns a function that makes the next calls take the given
+    durations, in nanoseconds, in order.
+    """
+    clock = SimpleNamespace(now=0, durations=[])
+
+    def perf_counter_ns():
+        return clock.now
+
+    def tick():
+        clock.now += clock.durations.pop(0)
+
+    monkeypatch.setattr(metrics, 'time',
+                        SimpleNamespace(perf_counter_ns=perf_counter_ns))
+
+    def set_durations(durations):
+        clock.durations = list(durations)
+        return tick
+
+    return set_durations
+
+
+class TestBenchmarkIterations:
+    """Test benchmark_iterations function."""
+
+    def test_no_warmup_by_default(self):
+        """Test that func is called exactly iterations times by default."""
+        calls = []
+        stats = benchmark_iterations(calls.append, 5, 'x')
+        assert len(calls) == 5
+        assert stats['iterations'] == 5
+        assert len(stats['times']) == 5
+
+    def test_warmup_calls_not_timed(self):
+        """Test that warm-up calls are made but not reported."""
+        calls = []
+        stats = benchmark_iterations(calls.append, 5, 'x', warmup=3)
+        assert len(calls) == 8
+        assert len(stats['times']) == 5
+
+    def test_passes_arguments(self):
+        """Test that positional and keyword arguments reach func."""
+        calls = []
+        benchmark_iterations(lambda a, b=None: calls.append((a, b)),
+                             2, 1, b=2)
+        assert calls == [(1, 2), (1, 2)]
+
+    def test_statistics_single_iteration(self, fake_clock):
+        """Test statistics for n=1: every figure is the one sample."""
+        func = fake_clock([2_000_000])
+        stats = benchmark_iterations(func, 1)
+        assert stats['times'] == [2.0]
+        assert stats['min_time_ms'] == stats['max_time_ms'] == 2.0
+        assert stats['median_time_ms'] == 2.0
+        assert stats['p95_time_ms'] == 2.0
+        assert stats['stdev_time_ms'] == 0.0
+
+    @pytest.mark.parametrize("n, p95", [(20, 19.0), (100, 95.0)])
+    def test_p95_nearest_rank(self, fake_clock, n, p95):
+        """Test that p95 is the nearest-rank 95th percentile."""
+        durations = [ms * 1_000_000 for ms in range(1, n + 1)]
+        random.Random(n).shuffle(durations)
+        func = fake_clock(durations)
+        stats = benchmark_iterations(func, n)
+        assert stats['p95_time_ms'] == p95
+        assert stats['min_time_ms'] == 1.0
+        assert stats['max_time_ms'] == float(n)
+        assert stats['median_time_ms'] == (n + 1) / 2
+        assert stats['total_time_ms'] == n * (n + 1) / 2
+
+
+class TestAutoIterations:
+    """Test auto_iterations function."""
+
+    def test_count_reaches_target(self, fake_clock):
+        """Test that count times one call's duration reaches target_ns."""
+        for per_call_ns in (1, 999, 1000, 1001, 70_000):
+            func = fake_clock([per_call_ns])
+            count = auto_iterations(func, target_ns=1_000_000)
+            assert count * per_call_ns >= 1_000_000
+            assert (count - 1) * per_call_ns < 1_000_000
+
+    def test_count_grows_with_target(self, fake_clock):
+        """Test that a larger target gives a larger count."""
+        counts = []
+        for target_ns in (10_000, 100_000, 1_000_000):
+            func = fake_clock([1000])
+            counts.append(auto_iterations(func, target_ns=target_ns))
+        assert counts == [10, 100, 1000]
+
+    def test_count_bounds(self, fake_clock):
+        """Test that the count is at least 1 and at most max_iterations."""
+        assert auto_iterations(fake_clock([5_000_000]),
+                               target_ns=1_000_000) == 1
+        assert auto_iterations(fake_clock([1]), target_ns=1_000_000,
+                               max_iterations=50) == 50
+
+
+class TestMeasurePeak:
+    """Test MemoryTracker.measure_peak context manager."""
+
+    def test_peak_filled_in_after_allocation(self):
+        """Test that peak_bytes covers an allocation made in the block."""
+        with MemoryTracker.measure_peak() as memory:
+            assert memory['peak_bytes'] == 0
+            buffer = bytearray(1_000_000)
+            del buffer
+        assert memory['peak_bytes'] >= 1_000_000
+
+    def test_tracing_stopped_afterwards(self):
+        """Test that tracing started for the block is stopped again."""
+        assert not tracemalloc.is_tracing()
+        with MemoryTracker.measure_peak():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+    def test_existing_tracing_left_running(self):
+        """Test that tracing already running is not stopped."""
+        tracemalloc.start()
+        try:
+            with MemoryTracker.measure_peak() as memory:
+                bytearray(100_000)
+            assert tracemalloc.is_tracing()
+            assert memory['peak_bytes'] > 0
+        finally:
+            tracemalloc.stop()
+
+
+class TestPerformanceValidator:
+    """Test PerformanceValidator results and report."""
+
+    @pytest.fixture
+    def validator(self):
+        """Validator with one passing and one failing validation."""
+        validator = PerformanceValidator()
+        validator.validate("Construction", 1.5, 2.0, less_is_better=True,
+                           unit="ms")
+        validator.validate("Throughput", 50.0, 100.0, less_is_better=False,
+                           unit="ops/s")
+        return validator
+
+    def test_results_keep_validation_keys(self, validator):
+        """Test that each exported validation has the original keys."""
+        results = validator.get_results()
+        assert results['total_validations'] == 2
+        assert results['passed'] == 1
+        assert results['failed'] == 1
+        assert results['all_passed'] is False
+        assert results['validations'] == [
+            {
+                'name': 'Construction',
+                'actual': 1.5,
+                'target': 2.0,
+                'unit': 'ms',
+                'passed': True,
+                'less_is_better': True,
+                'comparison': '1.50 <= 2.00'
+            },
+            {
+                'name': 'Throughput',
+                'actual': 50.0,
+                'target': 100.0,
+                'unit': 'ops/s',
+                'passed': False,
+                'less_is_better': False,
+                'comparison': '50.00 >= 100.00'
+            }
+        ]
+        assert all(list(v) == ['name', 'actual', 'target', 'unit', 'passed',
+                               'less_is_better', 'comparison']
+                   for v in results['validations'])
+
+    def test_results_serialize_as_objects(self, validator):
+        """Test that validations export to JSON as objects, not arrays."""
+        exported = json.loads(json.dumps(validator.get_results()))
+        assert exported['validations'][0]['name'] == 'Construction'
+        assert exported['validations'][1]['passed'] is False
+
+    def test_report(self, validator):
+        """Test report totals and one detail line per validation."""
+        report = validator.generate_report()
+        assert "Total Validations: 2" in report
+        assert "Passed: 1" in report
+        assert "Failed: 1" in report
+        assert "✗ SOME FAILED" in report
+        assert "  ✓ Construction: 1.50 <= 2.00 ms\n" in report
+        assert "  ✗ Throughput: 50.00 >= 100.00 ops/s\n" in report
@@ -35,7 +35,17 @@ from preprocessing.loader import (
     load_cached_reviews,
     save_to_cache,
     load_with_cache,
-    get_dataset_info
+    get_dataset_info,
+    get_datasets_info,
+    count_reviews_in_file,
+    scan_dataset,
+    load_manifest,
+    save_manifest,
+    get_review_cache_path,
+    get_leaf_cache_path,
+    load_leaf_hashes,
+    save_leaf_hashes,
+    prefetch_batches
 )
 
 
@@ -76,11 +86,16 @@ class TestNormalizeReview:
         assert result['overall'] == ''
 
     def test_normalize_preserves_original(self):
-        """Test that original dict is preserved."""
-        result = normalize_review(SAMPLE_REVIEW)
+        """Test that original dict is preserved when requested."""
+        result = normalize_review(SAMPLE_REVIEW, keep_original=True)
         assert '_original' in result
         assert result['_original'] == SAMPLE_REVIEW
 
+    def test_normalize_drops_original_by_default(self):
+        """Test that the raw dict is not referenced by default."""
+        result = normalize_review(SAMPLE_REVIEW)
+        assert '_original' not in result
+
     def test_normalize_converts_to_string(self):
         """Test that all fields are converted to strings."""
         review = {"reviewerID": 123, "overall": 5}
@@ -89,6 +104,13 @@ class TestNormalizeReview:
         assert isinstance(result['reviewerID'], str)
         assert isinstance(result['overall'], str)
 
+    @pytest.mark.parametrize("overall", [5.0, 5, True, 4.5, '5.0', 0.0])
+    def test_normalize_overall_matches_str(self, overall):
+        """Test that ratings keep their str() form, e.g. 5 stays '5'."""
+        review = {"reviewerID": "A123", "asin": "B456", "overall": overall}
+        assert normalize_review(review)['overall'] == str(overall)
+        assert extract_review_fields(review)['overall'] == str(overall)
+
 
 class TestGenerateCanonicalString:
     """Test generate_canonical_string function."""
@@ -148,6 +170,12 @@ class TestIsValidReview:
         review = {"reviewerID": "", "asin": "B456"}
         assert is_valid_review(review) is False
 
+    def test_invalid_whitespace_fields(self):
+        """Test that whitespace-only required fields are invalid."""
+        review = {"reviewerID": "A123", "asin": "  "}
+        assert is_valid_review(review) is False
+        assert is_valid_review(SAMPLE_REVIEW, require_all_fields=True) is True
+
     def test_require_all_fields(self):
         """Test require_all_fields parameter."""
         review = {"reviewerID": "A123", "asin": "B456"}
@@ -221,6 +249,21 @@ class TestSanitizeReviewText:
         result = sanitize_review_text(text)
         assert '  ' not in result
 
+    @pytest.mark.parametrize("text", [
+        "Great product",
+        " Great product ",
+        "Great\tproduct\r\n",
+        "Great\x0bproduct\x0c",
+        "Great 　product",
+        "Gr\x00eat product\x00 ",
+        "",
+        " ",
+    ])
+    def test_sanitize_matches_split_join(self, text):
+        """Test that the clean-text shortcut matches a full split/join."""
+        expected = ' '.join(text.replace('\x00', '').split())
+        assert sanitize_review_text(text) == expected
+
     def test_sanitize_truncates_long_text(self):
         """Test that long text is truncated."""
         text = "a" * 1000
@@ -248,6 +291,12 @@ class TestBatchNormalizeReviews:
         result = batch_normalize_reviews(reviews, filter_invalid=True)
         assert len(result) == 1
 
+    def test_batch_normalize_keep_original(self):
+        """Test that raw dicts are only kept when requested."""
+        reviews = [SAMPLE_REVIEW]
+        assert '_original' not in batch_normalize_reviews(reviews)[0]
+        assert batch_normalize_reviews(reviews, keep_original=True)[0]['_original'] == SAMPLE_REVIEW
+
 
 class TestGetReviewStats:
     """Test get_review_stats function."""
@@ -405,6 +454,252 @@ class TestLoadWithCache:
 
         assert len(reviews) == 10
 
+    def test_cache_written_to_review_cache_path(self, sample_json_file, tmp_path):
+        """Test that the cache lands where get_review_cache_path() says."""
+        cache_dir = str(tmp_path / "cache")
+        load_with_cache(str(sample_json_file), cache_dir=cache_dir, limit=5, show_progress=False)
+
+        assert get_review_cache_path(str(sample_json_file), cache_dir, 5).exists()
+
+    def test_cli_load_path_caches_same_records(self, tmp_path):
+        """Test that the CLI's load-and-hash path caches what load_with_cache does."""
+        from main import load_and_hash_dataset
+
+        filepath = tmp_path / "gaps.json"
+        with open(filepath, 'w') as f:
+            for i in range(8):
+                f.write(json.dumps(dict(SAMPLE_REVIEW, reviewerID=f"A{i}")) + '\n')
+                if i % 3 == 0:
+                    f.write('\n{not json}\n')
+
+        for limit in (5, None):
+            cached_dir = str(tmp_path / "cached")
+            hashed_dir = str(tmp_path / "hashed")
+            expected = load_with_cache(str(filepath), cache_dir=cached_dir, limit=limit,
+                                       show_progress=False)
+            reviews = load_and_hash_dataset(str(filepath), hashed_dir, limit)
+
+            assert reviews == expected
+            assert (load_cached_reviews(get_review_cache_path(str(filepath), hashed_dir, limit))
+                    == load_cached_reviews(get_review_cache_path(str(filepath), cached_dir, limit)))
+
+
+class TestGetDatasetsInfo:
+    """Test directory-wide dataset info."""
+
+    def test_get_info_for_directory(self, tmp_path):
+        """Test that every file is scanned, in parallel workers."""
+        for name, n in [("a.json", 3), ("b.json", 5)]:
+            with open(tmp_path / name, 'w') as f:
+                for _ in range(n):
+                    f.write(json.dumps(SAMPLE_REVIEW) + '\n')
+
+        infos = get_datasets_info(str(tmp_path), max_workers=2)
+
+        assert list(infos) == ["a.json", "b.json"]
+        assert infos["a.json"]["estimated_count"] == 3
+        assert infos["b.json"]["estimated_count"] == 5
+
+        manifest = load_manifest(str(tmp_path))
+        assert set(manifest) == {"a.json", "b.json"}
+
+    def test_get_info_for_empty_directory(self, tmp_path):
+        """Test that an empty directory yields no entries."""
+        assert get_datasets_info(str(tmp_path)) == {}
+
+
+class TestPrefetchBatches:
+    """Test background batch loading."""
+
+    def test_prefetch_matches_batch_loader(self, sample_json_file):
+        """Test that prefetched batches equal batch_loader output."""
+        expected = list(batch_loader(str(sample_json_file), batch_size=3))
+        batches = list(prefetch_batches(str(sample_json_file), batch_size=3, max_pending=1))
+
+        assert batches == expected
+
+    def test_prefetch_early_exit(self, sample_json_file):
+        """Test that abandoning the generator stops the loader thread."""
+        gen = prefetch_batches(str(sample_json_file), batch_size=1, max_pending=1)
+        first = next(gen)
+        gen.close()
+
+        assert len(first) == 1
+
+    def test_prefetch_nonexistent_file(self):
+        """Test that a missing file raises immediately."""
+        with pytest.raises(FileNotFoundError):
+            next(prefetch_batches("nonexistent.json"))
+
+
+class TestLeafHashCache:
+    """Test the binary leaf hash cache."""
+
+    def test_leaf_cache_roundtrip(self, sample_json_file, tmp_path):
+        """Test saving and loading leaf hashes."""
+        leaves = [bytes([i]) * 32 for i in range(5)]
+        cache_path = get_leaf_cache_path(str(sample_json_file), str(tmp_path / "cache"))
+
+        assert save_leaf_hashes(leaves, str(cache_path), str(sample_json_file))
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file)) == leaves
+
+    def test_leaf_cache_accepts_packed_hashes(self, sample_json_file, tmp_path):
+        """Test saving hashes that are already packed into one bytes object."""
+        leaves = [bytes([i]) * 32 for i in range(5)]
+        cache_path = tmp_path / "reviews.leaves"
+
+        assert save_leaf_hashes(b''.join(leaves), str(cache_path), str(sample_json_file))
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file)) == leaves
+
+    def test_leaf_cache_invalidated_by_source_change(self, sample_json_file, tmp_path):
+        """Test that a modified source file invalidates the cache."""
+        cache_path = tmp_path / "reviews.leaves"
+        save_leaf_hashes([b'\x00' * 32], str(cache_path), str(sample_json_file))
+
+        with open(sample_json_file, 'a') as f:
+            f.write(json.dumps(SAMPLE_REVIEW) + '\n')
+
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file)) is None
+
+    def test_leaf_cache_invalidated_by_format_version(self, sample_json_file, tmp_path,
+                                                      monkeypatch):
+        """Test that hashes cached under another format version are not reused."""
+        import preprocessing.loader as loader
+        cache_path = tmp_path / "reviews.leaves"
+        save_leaf_hashes([b'\x00' * 32], str(cache_path), str(sample_json_file))
+
+        monkeypatch.setattr(loader, 'LEAF_CACHE_VERSION', loader.LEAF_CACHE_VERSION + 1)
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file)) is None
+
+    def test_leaf_cache_tied_to_review_cache(self, sample_json_file, tmp_path):
+        """Test that rewriting the review cache invalidates the leaf hashes."""
+        records_path = tmp_path / "reviews.pkl"
+        cache_path = tmp_path / "reviews.leaves"
+        save_to_cache([SAMPLE_REVIEW], str(records_path))
+        save_leaf_hashes([b'\x00' * 32], str(cache_path), str(sample_json_file),
+                         records_path=str(records_path))
+
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file),
+                                str(records_path)) == [b'\x00' * 32]
+        # Saved against a review cache, so not valid without one
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file)) is None
+
+        save_to_cache([SAMPLE_REVIEW, SAMPLE_REVIEW], str(records_path))
+        assert load_leaf_hashes(str(cache_path), str(sample_json_file),
+                                str(records_path)) is None
+
+    def test_leaf_cache_missing(self, sample_json_file, tmp_path):
+        """Test loading a nonexistent cache."""
+        assert load_leaf_hashes(str(tmp_path / "none.leaves"), str(sample_json_file)) is None
+
+    def test_leaf_cache_path_matches_review_cache(self):
+        """Test that the path follows the review cache naming."""
+        path = get_leaf_cache_path("data/raw/Electronics_5.json", "data/cache", 1000)
+        assert path == Path("data/cache/Electronics_5_1000.leaves")
+
+
+class TestScanDataset:
+    """Test single-pass dataset scanning."""
+
+    def test_scan_counts_and_samples(self, sample_json_file):
+        """Test that count and sample come from the same scan."""
+        stats = scan_dataset(str(sample_json_file), sample_size=3)
+        assert stats['count'] == 10
+        assert len(stats['samples']) == 3
+        assert 'reviewerID' in stats['fields']
+        assert stats['rating_distribution'] == {str(SAMPLE_REVIEW['overall']): 3}
+
+    def test_scan_samples_across_chunk_boundary(self, tmp_path, monkeypatch):
+        """Test that records split across read chunks are parsed whole."""
+        import preprocessing.loader as loader
+        monkeypatch.setattr(loader, 'SCAN_CHUNK_SIZE', 7)
+
+        filepath = tmp_path / "small_chunks.json"
+        with open(filepath, 'w') as f:
+            for _ in range(4):
+                f.write(json.dumps(SAMPLE_REVIEW) + '\n')
+            f.write(json.dumps(SAMPLE_REVIEW))
+
+        stats = scan_dataset(str(filepath), sample_size=10)
+        assert stats['count'] == 5
+        assert stats['samples'] == [SAMPLE_REVIEW] * 5
+
+    def test_scan_samples_skip_blank_lines(self, tmp_path):
+        """Test that empty, '\\r' and whitespace-only lines are not sampled."""
+        filepath = tmp_path / "blank_lines.json"
+        line = json.dumps(SAMPLE_REVIEW)
+        filepath.write_bytes(f"{line}\n\n\r\n   \n\t\r\n{line}\r\n".encode())
+
+        stats = scan_dataset(str(filepath), sample_size=10)
+        assert stats['samples'] == [SAMPLE_REVIEW] * 2
+
+    def test_scan_streams_json_array(self, tmp_path, monkeypatch):
+        """Test that arrays are parsed across small chunks, including multibyte text."""
+        import preprocessing.loader as loader
+        monkeypatch.setattr(loader, 'SCAN_CHUNK_SIZE', 5)
+
+        review = dict(SAMPLE_REVIEW, reviewText="Très bien — 5★")
+        filepath = tmp_path / "array.json"
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump([review] * 4, f, ensure_ascii=False, indent=2)
+
+        stats = scan_dataset(str(filepath), sample_size=2)
+        assert stats['count'] == 4
+        assert stats['samples'] == [review, review]
+
+    def test_scan_truncated_json_array(self, tmp_path):
+        """Test that an unterminated array raises."""
+        filepath = tmp_path / "truncated.json"
+        filepath.write_text('[' + json.dumps(SAMPLE_REVIEW) + ',')
+
+        with pytest.raises(json.JSONDecodeError):
+            scan_dataset(str(filepath))
+
+    @pytest.mark.parametrize("text", ['[1,,2]', '[1 2]', '[,1]', '[1,]', '[,]'])
+    def test_scan_malformed_json_array(self, tmp_path, text):
+        """Test that missing, doubled or stray commas raise like json.load."""
+        filepath = tmp_path / "malformed.json"
+        filepath.write_text(text)
+
+        with pytest.raises(json.JSONDecodeError):
+            scan_dataset(str(filepath))
+
+    @pytest.mark.parametrize("text", ['[1] x', '[1]]', '[] []', '[1]\n{"a": 1}'])
+    def test_scan_json_array_trailing_data(self, tmp_path, text):
+        """Test that content after the closing ']' raises like json.load."""
+        filepath = tmp_path / "trailing.json"
+        filepath.write_text(text)
+
+        with pytest.raises(json.JSONDecodeError):
+            scan_dataset(str(filepath))
+
+    def test_scan_json_array_trailing_whitespace(self, tmp_path, monkeypatch):
+        """Test that whitespace after the closing ']' is allowed."""
+        import preprocessing.loader as loader
+        monkeypatch.setattr(loader, 'SCAN_CHUNK_SIZE', 3)
+
+        filepath = tmp_path / "trailing.json"
+        filepath.write_text('[1, 2]  \r\n\t\n')
+
+        assert count_reviews_in_file(str(filepath)) == 2
+
+    def test_scan_json_array_number_across_chunks(self, tmp_path, monkeypatch):
+        """Test that a number split by a chunk boundary is parsed whole."""
+        import preprocessing.loader as loader
+        monkeypatch.setattr(loader, 'SCAN_CHUNK_SIZE', 2)
+
+        filepath = tmp_path / "numbers.json"
+        filepath.write_text('[1.5e3, -20]')
+
+        assert count_reviews_in_file(str(filepath)) == 2
+        with open(filepath, 'rb') as f:
+            assert list(loader._iter_json_array(f)) == [1500.0, -20]
+
+    def test_scan_nonexistent_file(self):
+        """Test that scanning a missing file raises."""
+        with pytest.raises(FileNotFoundError):
+            scan_dataset("nonexistent.json")
+
 
 class TestGetDatasetInfo:
     """Test get_dataset_info function."""
@@ -424,3 +719,106 @@ class TestGetDatasetInfo:
         """Test getting info for nonexistent file."""
         info = get_dataset_info("nonexistent.json")
         assert 'error' in info
+
+    def test_get_info_json_array(self, tmp_path):
+        """Test getting info for a JSON array file."""
+        filepath = tmp_path / "array.json"
+        with open(filepath, 'w') as f:
+            json.dump([SAMPLE_REVIEW] * 3, f)
+
+        info = get_dataset_info(str(filepath))
+        assert info['estimated_count'] == 3
+        assert info['sample_count'] == 3
+
+    def test_get_info_skips_malformed_sample_lines(self, tmp_path):
+        """Test that malformed and blank lines are skipped when sampling."""
+        filepath = tmp_path / "mixed.json"
+        with open(filepath, 'w') as f:
+            f.write(json.dumps(SAMPLE_REVIEW) + '\n')
+            f.write('not json\n')
+            f.write('\n')
+            f.write(json.dumps(SAMPLE_REVIEW))
+
+        info = get_dataset_info(str(filepath))
+        assert info['sample_count'] == 2
+
+    def test_get_info_writes_manifest(self, sample_json_file):
+        """Test that dataset stats are cached in the directory manifest."""
+        get_dataset_info(str(sample_json_file))
+
+        manifest = load_manifest(str(sample_json_file.parent))
+        assert sample_json_file.name in manifest
+        assert manifest[sample_json_file.name]['stats']['estimated_count'] == 10
+
+    def test_get_info_uses_manifest(self, sample_json_file):
+        """Test that a fresh manifest entry is returned without rescanning."""
+        get_dataset_info(str(sample_json_file))
+
+        # Tamper with the cached count; an unchanged file should reuse it
+        manifest = load_manifest(str(sample_json_file.parent))
+        manifest[sample_json_file.name]['stats']['estimated_count'] = 999
+        save_manifest(str(sample_json_file.parent), manifest)
+
+        info = get_dataset_info(str(sample_json_file))
+        assert info['estimated_count'] == 999
+
+    def test_get_info_rescans_changed_file(self, sample_json_file):
+        """Test that a stale manifest entry triggers a rescan."""
+        get_dataset_info(str(sample_json_file))
+
+        with open(sample_json_file, 'a') as f:
+            f.write(json.dumps(SAMPLE_REVIEW) + '\n')
+
+        info = get_dataset_info(str(sample_json_file))
+        assert info['estimated_count'] == 11
+
+
+class TestCountReviewsInFile:
+    """Test count_reviews_in_file function."""
+
+    def test_count_line_delimited(self, sample_json_file):
+        """Test counting line-delimited reviews."""
+        assert count_reviews_in_file(str(sample_json_file)) == 10
+
+    def test_count_without_trailing_newline(self, tmp_path):
+        """Test that an unterminated last line is still counted."""
+        filepath = tmp_path / "reviews.json"
+        filepath.write_text(json.dumps(SAMPLE_REVIEW) + '\n' + json.dumps(SAMPLE_REVIEW))
+
+        assert count_reviews_in_file(str(filepath)) == 2
+
+    def test_count_json_array(self, tmp_path):
+        """Test counting reviews in JSON array format."""
+        filepath = tmp_path / "reviews.json"
+        filepath.write_text(json.dumps([SAMPLE_REVIEW] * 3))
+
+        assert count_reviews_in_file(str(filepath)) == 3
+
+    def test_count_json_array_after_long_whitespace(self, tmp_path):
+        """Test that an array is detected after any amount of leading whitespace."""
+        filepath = tmp_path / "reviews.json"
+        filepath.write_text(' \t\r\n' * 3000 + json.dumps([SAMPLE_REVIEW] * 3))
+
+        assert count_reviews_in_file(str(filepath)) == 3
+
+    def test_count_json_array_with_bom(self, tmp_path):
+        """Test that an array after a UTF-8 byte order mark is detected and parsed."""
+        filepath = tmp_path / "reviews.json"
+        filepath.write_text('\n' + json.dumps([SAMPLE_REVIEW] * 3), encoding='utf-8-sig')
+
+        assert count_reviews_in_file(str(filepath)) == 3
+        stats = scan_dataset(str(filepath), sample_size=1)
+        assert stats['samples'] == [SAMPLE_REVIEW]
+
+    def test_count_line_delimited_with_bom(self, tmp_path):
+        """Test that a byte order mark does not make line-delimited JSON an array."""
+        filepath = tmp_path / "reviews.json"
+        filepath.write_text(json.dumps(SAMPLE_REVIEW) + '\n' + json.dumps(SAMPLE_REVIEW) + '\n',
+                            encoding='utf-8-sig')
+
+        assert count_reviews_in_file(str(filepath)) == 2
+
+    def test_count_nonexistent_file(self):
+        """Test counting a nonexistent file raises error."""
+        with pytest.raises(FileNotFoundError):
+            count_reviews_in_file("nonexistent.json")